@@ -0,0 +1,13 @@
+##This script runs the Completely Fair Scheduler (modelled on Linux CFS) from the cpusim package on a job CSV file.
+##The job with the smallest virtual runtime runs next, for its weighted share of the --latency period but never
+##less than --min-granularity; heavier jobs (see --weights) accumulate virtual runtime more slowly. The output
+##CSV has the same columns as the Round Robin output.
+##Equivalent to "python -m cpusim cfs"; the options are defined in cpusim/cli.py.
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from cpusim.cli import run_algorithm
+
+run_algorithm('cfs')
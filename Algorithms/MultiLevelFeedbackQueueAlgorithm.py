@@ -0,0 +1,13 @@
+##This script runs the Multi-Level Feedback Queue scheduler from the cpusim package on a job CSV file.
+##New jobs start at the top level; a job that uses its whole quantum drops one level, where the quantum
+##is longer, and every --boost time units all waiting jobs return to the top level. The output CSV has
+##the same columns as the Round Robin output.
+##Equivalent to "python -m cpusim mlfq"; the options are defined in cpusim/cli.py.
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from cpusim.cli import run_algorithm
+
+run_algorithm('mlfq')
@@ -0,0 +1,13 @@
+##This script runs the stride scheduler from the cpusim package on a job CSV file.
+##Each job's tickets (its weight from --weights) give it a stride inversely proportional to them; the job
+##with the smallest pass value runs for one --quantum and its pass advances by its stride, so CPU time is
+##shared in proportion to tickets. The output CSV has the same columns as the Round Robin output.
+##Equivalent to "python -m cpusim stride"; the options are defined in cpusim/cli.py.
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from cpusim.cli import run_algorithm
+
+run_algorithm('stride')
@@ -0,0 +1,24 @@
+##This script runs the agreement check of every benchmark that compares two engines, on a small trace
+##(--jobs, 2000 by default), so a change that makes the engines disagree is caught without running the
+##full benchmarks. It stops with the benchmark's error message at the first disagreement.
+
+import os
+import sys
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import SJFScalingBenchmark
+import FCFSVectorizedBenchmark
+
+BENCHMARKS = (SJFScalingBenchmark, FCFSVectorizedBenchmark)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--jobs", type=int, default=2000, help="Size of the synthetic trace")
+    parser.add_argument("--seed", type=int, default=1, help="Seed for the synthetic trace")
+    args = parser.parse_args()
+
+    for benchmark in BENCHMARKS:
+        benchmark.runAgreementCheck(args.jobs, args.seed)
+        print(f"{benchmark.__name__}: engines agree on the {args.jobs}-job trace")
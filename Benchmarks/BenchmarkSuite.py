@@ -0,0 +1,131 @@
+##This benchmark suite times all four schedulers end to end on synthetic traces drawn from the Job1
+##and Job2 distributions at increasing sizes (1k, 10k, 100k and 1M jobs by default). Every run is split
+##into parse (load_jobs), simulate and write (CSV output) phases and executes in a fresh process, so the
+##reported peak RSS belongs to that run alone. Results are written to a JSON file that can be compared
+##between versions to track regressions; --compare prints the cases that got slower than a previous report.
+
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import tempfile
+import subprocess
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+from cpusim import SCHEDULERS, load_jobs
+from cpusim.generators import generate_trace
+from cpusim.output import WRITERS
+from cpusim.sweep import QUANTUM_ALGORITHMS
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+
+def peakRssKb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def runCase(tracePath, algorithm, quantum, outPath):
+    # executed in a fresh worker process
+    start = time.perf_counter()
+    jobs = load_jobs(tracePath)
+    parsed = time.perf_counter()
+    scheduler = SCHEDULERS[algorithm](quantum) if algorithm in QUANTUM_ALGORITHMS else SCHEDULERS[algorithm]()
+    result = scheduler.run(jobs)
+    simulated = time.perf_counter()
+    WRITERS[algorithm](result, outPath)
+    written = time.perf_counter()
+    os.remove(outPath)
+    return {
+        'parseSeconds': parsed - start,
+        'simulateSeconds': simulated - parsed,
+        'writeSeconds': written - simulated,
+        'totalSeconds': written - start,
+        'peakRssKb': peakRssKb(),
+        'averageResponseTime': result.averageResponseTime,
+        'averageTurnAroundTime': result.averageTurnAroundTime,
+    }
+
+
+def compareReports(previous, current, tolerance):
+    # report cases whose total time grew by more than 'tolerance' (a fraction) since 'previous'
+    key = lambda case: (case['dataset'], case['jobs'], case['algorithm'], case['quantum'])
+    before = {key(case): case for case in previous['results']}
+    regressions = []
+    for case in current['results']:
+        old = before.get(key(case))
+        if old and case['totalSeconds'] > old['totalSeconds'] * (1 + tolerance):
+            regressions.append((key(case), old['totalSeconds'], case['totalSeconds']))
+    return regressions
+
+
+def gitRevision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", default="1000,10000,100000,1000000", help="Comma-separated trace sizes")
+    parser.add_argument("--presets", default="job1,job2", help="Comma-separated generator presets")
+    parser.add_argument("--algorithms", default=','.join(SCHEDULERS), help="Comma-separated algorithms")
+    parser.add_argument("--quantum", type=int, default=50, help="Time quantum for Round Robin and stride")
+    parser.add_argument("--seed", type=int, default=1, help="Seed for the synthetic traces")
+    parser.add_argument("--label", default=None, help="Version label stored in the report (default: git revision)")
+    parser.add_argument("--out", default="benchmark.json", help="Path to the JSON report")
+    parser.add_argument("--compare", default=None, help="Previous JSON report to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed slowdown before a case is flagged")
+    args = parser.parse_args()
+
+    report = {
+        'label': args.label or gitRevision(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'seed': args.seed,
+        'quantum': args.quantum,
+        'results': [],
+    }
+
+    context = multiprocessing.get_context('spawn')
+    with tempfile.TemporaryDirectory() as scratch:
+        for preset in args.presets.split(','):
+            for numJobs in [int(s) for s in args.sizes.split(',')]:
+                tracePath = os.path.join(scratch, f"{preset}_{numJobs}.csv")
+                generate_trace(tracePath, numJobs, preset, seed=args.seed)
+                for algorithm in args.algorithms.split(','):
+                    quantum = args.quantum if algorithm in QUANTUM_ALGORITHMS else None
+                    outPath = os.path.join(scratch, f"{preset}_{numJobs}_{algorithm}.csv")
+                    with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                        case = pool.submit(runCase, tracePath, algorithm, quantum, outPath).result()
+                    case = dict(dataset=preset, jobs=numJobs, algorithm=algorithm, quantum=quantum, **case)
+                    report['results'].append(case)
+                    print(f"{preset:>5} {numJobs:>8} {algorithm:>5}  parse {case['parseSeconds']:7.3f}s"
+                          f"  simulate {case['simulateSeconds']:7.3f}s  write {case['writeSeconds']:7.3f}s"
+                          f"  peak RSS {case['peakRssKb']} KB")
+
+    with open(args.out, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"Benchmark report saved to {args.out}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compareReports(json.load(f), report, args.tolerance)
+        for (preset, numJobs, algorithm, quantum), before, after in regressions:
+            print(f"REGRESSION {preset} {numJobs} {algorithm}: {before:.3f}s -> {after:.3f}s")
+        if regressions:
+            sys.exit(1)
@@ -0,0 +1,73 @@
+##This benchmark times the NumPy First Come First Serve kernel (cpusim.fcfs_numpy) against the
+##pure-Python engine (cpusim.fcfs) on synthetic Job1-style traces, and checks that both produce the
+##same schedule. The Python engine is only run up to --python-limit jobs; the kernel runs at every size.
+##One run with an unsorted copy of the trace exercises the argsort fallback.
+
+import os
+import sys
+import time
+import argparse
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from cpusim import Jobs, fcfs, fcfs_numpy
+
+
+def generateJob1Trace(numJobs, seed):
+    # job size ~ N(150, 20) (at least 1), inter-arrival ~ N(75, 20) (at least 0)
+    rng = np.random.default_rng(seed)
+    jobSize = np.maximum(1, rng.normal(150, 20, numJobs).astype(np.int64))
+    arrivalTime = np.cumsum(np.maximum(0, rng.normal(75, 20, numJobs).astype(np.int64)))
+    return Jobs(np.arange(numJobs, dtype=np.int64), arrivalTime, jobSize)
+
+
+def reverseJobs(jobs):
+    return Jobs(jobs.index[::-1], jobs.arrival[::-1], jobs.size[::-1])
+
+
+def checkAgreement(numJobs, listJobs, pythonResult, numpyResult, unsortedResult):
+    if pythonResult.endTime.tolist() != numpyResult.endTime.tolist():
+        raise SystemExit(f"Engines disagree on the {numJobs}-job trace")
+    # jobs that arrive together swap places when reversed, so compare against the Python engine
+    if fcfs(reverseJobs(listJobs)).endTime.tolist() != unsortedResult.endTime.tolist():
+        raise SystemExit(f"Unsorted fallback disagrees on the {numJobs}-job trace")
+
+
+def runAgreementCheck(numJobs=2000, seed=1):
+    jobs = generateJob1Trace(numJobs, seed)
+    listJobs = Jobs(jobs.index.tolist(), jobs.arrival.tolist(), jobs.size.tolist())
+    checkAgreement(numJobs, listJobs, fcfs(listJobs), fcfs_numpy(jobs), fcfs_numpy(reverseJobs(jobs)))
+
+
+def timeEngine(engine, jobs):
+    start = time.perf_counter()
+    result = engine(jobs)
+    return time.perf_counter() - start, result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", default="100000,1000000,10000000", help="Comma-separated trace sizes")
+    parser.add_argument("--python-limit", type=int, default=1000000, help="Largest trace size to run the Python engine on")
+    parser.add_argument("--seed", type=int, default=1, help="Seed for the synthetic traces")
+    args = parser.parse_args()
+
+    print(f"{'Jobs':>10} {'Python (s)':>12} {'NumPy (s)':>10} {'Unsorted (s)':>13} {'Speedup':>9}")
+    for numJobs in [int(s) for s in args.sizes.split(',')]:
+        jobs = generateJob1Trace(numJobs, args.seed)
+        numpySeconds, numpyResult = timeEngine(fcfs_numpy, jobs)
+
+        # reverse the trace so the kernel has to sort it
+        unsortedSeconds, unsortedResult = timeEngine(fcfs_numpy, reverseJobs(jobs))
+
+        if numJobs <= args.python_limit:
+            listJobs = Jobs(jobs.index.tolist(), jobs.arrival.tolist(), jobs.size.tolist())
+            pythonSeconds, pythonResult = timeEngine(fcfs, listJobs)
+            checkAgreement(numJobs, listJobs, pythonResult, numpyResult, unsortedResult)
+            pythonText = f"{pythonSeconds:.3f}"
+            speedup = f"{pythonSeconds / numpySeconds:.0f}x"
+        else:
+            pythonText = "skipped"
+            speedup = "-"
+        print(f"{numJobs:>10} {pythonText:>12} {numpySeconds:>10.3f} {unsortedSeconds:>13.3f} {speedup:>9}")
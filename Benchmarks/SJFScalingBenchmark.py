@@ -0,0 +1,131 @@
+##This benchmark compares the original Shortest Job First loop, which rescans every job for each row,
+##against the heap-based engine in cpusim.sjf. Synthetic traces follow the
+##Job1 distribution (job size ~ N(150, 20), inter-arrival ~ N(75, 20)) and are generated with a fixed seed.
+##The legacy engine is quadratic, so it is only timed up to --legacy-limit jobs; larger sizes report an
+##estimate extrapolated from the largest measured legacy run.
+
+import os
+import sys
+import time
+import random as rand
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from cpusim import Jobs, sjf
+
+
+def generateJob1Trace(numJobs, seed):
+    rng = rand.Random(seed)
+    arrivalTime = [0] * numJobs
+    jobSize = [0] * numJobs
+    clock = 0
+    for x in range(numJobs):
+        jobSize[x] = max(1, int(rng.gauss(150, 20)))
+        clock += max(0, int(rng.gauss(75, 20)))
+        arrivalTime[x] = clock
+    return arrivalTime, jobSize
+
+
+def legacyShortestJobFirst(arrivalTime, jobSize):
+    # the original O(n^2) loop from ShortestJobFirstAlgorithm.py, kept here only as a reference point
+    numJobs = len(arrivalTime)
+    endTime        = [0] * numJobs
+    startJob       = [0] * numJobs
+    responseTime   = [0] * numJobs
+    turnAroundTime = [0] * numJobs
+    jobState       = [0] * numJobs
+    clock = 0
+
+    for index in range(numJobs):
+        flag = False
+        if index == 0:
+            clock = arrivalTime[index] + jobSize[index]
+            endTime[index] = arrivalTime[index] + jobSize[index]
+            startJob[index] = arrivalTime[index]
+            responseTime[index] = 0
+            turnAroundTime[index] = endTime[index] - arrivalTime[index]
+            jobState[index] = 2
+
+        for i in range(numJobs):
+            if jobState[i] != 2 and arrivalTime[i] <= clock:
+                jobState[i] = 1
+                flag = True
+
+        if not flag:
+            candidates = [i for i in range(numJobs) if jobState[i] != 2]
+            if candidates:
+                next_i = min(candidates, key=lambda i: arrivalTime[i])
+                clock = arrivalTime[next_i]
+                for i in candidates:
+                    if arrivalTime[i] <= clock and jobState[i] != 2:
+                        jobState[i] = 1
+
+        shortest_job_index = None
+        for i, state in enumerate(jobState):
+            if state == 1:
+                if shortest_job_index is None or jobSize[i] < jobSize[shortest_job_index]:
+                    shortest_job_index = i
+
+        if shortest_job_index is not None:
+            clock = clock + jobSize[shortest_job_index]
+            endTime[shortest_job_index] = clock
+            startJob[shortest_job_index] = endTime[shortest_job_index] - jobSize[shortest_job_index]
+            responseTime[shortest_job_index] = startJob[shortest_job_index] - arrivalTime[shortest_job_index]
+            turnAroundTime[shortest_job_index] = endTime[shortest_job_index] - arrivalTime[shortest_job_index]
+            jobState[shortest_job_index] = 2
+
+    return endTime, startJob, responseTime, turnAroundTime, jobState
+
+
+def heapShortestJobFirst(arrivalTime, jobSize):
+    result = sjf(Jobs(range(len(arrivalTime)), arrivalTime, jobSize))
+    return result.endTime, result.firstStart, result.responseTime, result.turnAroundTime, result.jobState
+
+
+def checkAgreement(numJobs, legacyResult, heapResult):
+    # the engine returns int64 array columns and the legacy loop lists, so compare them as lists
+    if [list(column) for column in legacyResult] != [list(column) for column in heapResult]:
+        raise SystemExit(f"Engines disagree on the {numJobs}-job trace")
+
+
+def runAgreementCheck(numJobs=2000, seed=1):
+    arrivalTime, jobSize = generateJob1Trace(numJobs, seed)
+    checkAgreement(numJobs, legacyShortestJobFirst(arrivalTime, jobSize), heapShortestJobFirst(arrivalTime, jobSize))
+
+
+def timeEngine(engine, arrivalTime, jobSize):
+    start = time.perf_counter()
+    result = engine(arrivalTime, jobSize)
+    return time.perf_counter() - start, result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", default="10000,100000,1000000", help="Comma-separated trace sizes")
+    parser.add_argument("--legacy-limit", type=int, default=10000, help="Largest trace size to run the legacy engine on")
+    parser.add_argument("--seed", type=int, default=1, help="Seed for the synthetic traces")
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(',')]
+    legacyPoint = None  # (numJobs, seconds) of the largest measured legacy run
+
+    print(f"{'Jobs':>10} {'Legacy (s)':>14} {'Heap (s)':>10} {'Speedup':>10}")
+    for numJobs in sizes:
+        arrivalTime, jobSize = generateJob1Trace(numJobs, args.seed)
+        heapSeconds, heapResult = timeEngine(heapShortestJobFirst, arrivalTime, jobSize)
+
+        if numJobs <= args.legacy_limit:
+            legacySeconds, legacyResult = timeEngine(legacyShortestJobFirst, arrivalTime, jobSize)
+            checkAgreement(numJobs, legacyResult, heapResult)
+            legacyPoint = (numJobs, legacySeconds)
+            legacyText = f"{legacySeconds:.3f}"
+        elif legacyPoint is not None:
+            # quadratic extrapolation from the largest measured run
+            legacySeconds = legacyPoint[1] * (numJobs / legacyPoint[0]) ** 2
+            legacyText = f"~{legacySeconds:.0f} (est)"
+        else:
+            legacySeconds = None
+            legacyText = "skipped"
+
+        speedup = f"{legacySeconds / heapSeconds:.0f}x" if legacySeconds else "-"
+        print(f"{numJobs:>10} {legacyText:>14} {heapSeconds:>10.3f} {speedup:>10}")
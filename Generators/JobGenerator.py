@@ -0,0 +1,17 @@
+##This script generates a synthetic job trace with the cpusim generators. Job sizes and inter-arrival
+##times come from configurable distributions (normal, exponential, uniform, constant, or a bimodal
+##mix like Job2's 80% large / 20% small jobs), drawn with numpy.random.Generator from an explicit seed.
+##Jobs are generated and written in fixed-size chunks, so memory stays bounded for 100M-job traces.
+##Output ending in .trace is written in the binary trace format, anything else as CSV.
+##Equivalent to "python -m cpusim generate"; the options are defined in cpusim/generators.py.
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+# JobGenerator1.py and JobGenerator2.py import main from here
+from cpusim.generators import main
+
+
+if __name__ == "__main__":
+    main()
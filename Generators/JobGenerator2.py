@@ -1,32 +1,6 @@
-import random as rand
-import numpy as np
-import matplotlib.pyplot as plt
-import csv
+##Generates the Job2 dataset: 1500 jobs arriving ~ N(75, 20) apart, 80% of them large (~ N(250, 15))
+##and 20% small (~ N(50, 10)). Accepts the same options as JobGenerator.py (--seed, --jobs, --out, ...).
 
-numJobs = 1500
-randNum=0
-jobTime = [0]*1500
-jobSize = [0]*1500
+from JobGenerator import main
 
-for x in range(numJobs):
-    arrTime = int (rand.gauss(75,20))
-    jobTime[x] = arrTime
-    if (x>=1):
-        jobTime[x] = jobTime[x-1] + jobTime[x]
-    randNum = int (100*(rand.random()))
-    if (randNum > 80): # large jobs, mean runtime of 250 std dev 15
-        jobSize[x] = int (rand.gauss(50,10))
-    if (randNum < 80):
-        jobSize[x] = int (rand.gauss(250,15))
-
-with open('Job2.csv', 'w', newline='') as file:
-    writer = csv.writer(file)
-
-    # Write header row
-    writer.writerow(["Index", "Arrival Time", "Job Size"])
-
-    # Write data rows
-    for x in range(numJobs):
-        writer.writerow([x, jobTime[x], jobSize[x]])
-
-print("CSV file processed successfully.")
+main(preset='job2', numJobs=1500, out='Job2.csv')
@@ -0,0 +1,33 @@
+"""CPU scheduling simulator library.
+
+Every algorithm takes an in-memory :class:`Jobs` array and returns a
+:class:`ScheduleResult`::
+
+    from cpusim import load_jobs, round_robin
+
+    result = round_robin(load_jobs('Data/Job2.csv'), quantum=50)
+    print(result.averageResponseTime)
+"""
+
+from .jobs import Jobs, load_jobs
+from .results import ScheduleResult
+from .scheduler import Scheduler
+from .fcfs import FirstComeFirstServe, fcfs, fcfs_numpy
+from .sjf import ShortestJobFirst, sjf
+from .stcf import ShortestTimeToCompletionFirst, stcf
+from .roundrobin import RoundRobin, round_robin
+from .mlfq import MultiLevelFeedbackQueue, mlfq
+from .cfs import CompletelyFair, cfs
+from .stride import StrideScheduling, stride
+
+# scheduler classes by their short name, as used on the command line
+SCHEDULERS = {cls.name: cls for cls in (FirstComeFirstServe, ShortestJobFirst,
+                                        ShortestTimeToCompletionFirst, RoundRobin,
+                                        MultiLevelFeedbackQueue, CompletelyFair, StrideScheduling)}
+
+__all__ = [
+    'Jobs', 'load_jobs', 'ScheduleResult', 'Scheduler',
+    'FirstComeFirstServe', 'ShortestJobFirst', 'ShortestTimeToCompletionFirst', 'RoundRobin',
+    'MultiLevelFeedbackQueue', 'CompletelyFair', 'StrideScheduling', 'fcfs', 'fcfs_numpy', 'sjf', 'stcf',
+    'round_robin', 'mlfq', 'cfs', 'stride', 'SCHEDULERS',
+]
@@ -0,0 +1,221 @@
+"""On-disk cache of scheduler runs, keyed by trace content and scheduler parameters.
+
+A cache key is the SHA-256 of the trace file's bytes combined with the
+scheduler's ``repr`` (which spells out its parameters, e.g.
+``RoundRobin(quantum=50)``) and ``CACHE_VERSION``. Each entry stores the
+job columns and the per-job result columns in the binary results format
+of :mod:`cpusim.resultfile`, so a hit returns a full
+:class:`~cpusim.results.ScheduleResult` without parsing or simulating.
+The entry's summary is kept in the index as well.
+
+The cache directory holds ``index.json`` next to the entries. The index
+records each entry's size and last use, the hit, miss and eviction
+counters, and the digest of every trace path seen, keyed by size and
+modification time, so an unchanged trace is not hashed twice. When the
+entries exceed ``maxBytes``, the least recently used ones are evicted.
+
+Inspect or clear the cache from the repository root::
+
+    python -m cpusim.cache info
+    python -m cpusim.cache invalidate Data/Job2.csv
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import time
+
+from . import resultfile
+from .jobs import Jobs, load_jobs
+from .output import iter_chunks
+from .results import ScheduleResult
+
+# bump whenever a change to the engines alters their results
+CACHE_VERSION = 2
+DEFAULT_DIR = os.environ.get('CPUSIM_CACHE_DIR') or os.path.join(os.path.expanduser('~'), '.cache', 'cpusim')
+DEFAULT_MAX_BYTES = 1 << 30
+
+JOB_COLUMNS = ('index', 'arrival', 'size')
+RESULT_COLUMNS = ('firstStart', 'lastStart', 'endTime', 'responseTime', 'turnAroundTime',
+                  'jobState', 'contextSwitch')
+
+
+def trace_digest(path):
+    """SHA-256 of a trace file's contents, read in 1 MiB blocks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """A size-bounded LRU cache of :class:`ScheduleResult` objects in ``directory``."""
+
+    def __init__(self, directory=DEFAULT_DIR, maxBytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.maxBytes = maxBytes
+        os.makedirs(directory, exist_ok=True)
+        self.indexPath = os.path.join(directory, 'index.json')
+        try:
+            with open(self.indexPath) as f:
+                self.index = json.load(f)
+        except (OSError, ValueError):
+            self.index = {'entries': {}, 'digests': {}, 'hits': 0, 'misses': 0, 'evictions': 0}
+
+    def _save(self):
+        # write the index atomically so an interrupted run cannot corrupt it
+        temporary = self.indexPath + '.tmp'
+        with open(temporary, 'w') as f:
+            json.dump(self.index, f)
+        os.replace(temporary, self.indexPath)
+
+    def _entry_path(self, key):
+        return os.path.join(self.directory, key + '.results')
+
+    def digest(self, tracePath):
+        """Content digest of ``tracePath``, reused while its size and modification time are unchanged."""
+        path = os.path.abspath(tracePath)
+        status = os.stat(path)
+        known = self.index['digests'].get(path)
+        if known and known[0] == status.st_size and known[1] == status.st_mtime_ns:
+            return known[2]
+        digest = trace_digest(path)
+        self.index['digests'][path] = [status.st_size, status.st_mtime_ns, digest]
+        return digest
+
+    def key(self, tracePath, scheduler):
+        """Cache key for running ``scheduler`` over the trace at ``tracePath``."""
+        text = f"{CACHE_VERSION}\0{self.digest(tracePath)}\0{scheduler!r}"
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+    def get(self, tracePath, scheduler):
+        """Return the cached result, or None on a miss."""
+        key = self.key(tracePath, scheduler)
+        entry = self.index['entries'].get(key)
+        if entry is None or not os.path.exists(self._entry_path(key)):
+            self.index['entries'].pop(key, None)
+            self.index['misses'] += 1
+            self._save()
+            return None
+        columns = resultfile.load_results(self._entry_path(key))
+        jobs = Jobs(*(columns[name] for name in JOB_COLUMNS))
+        result = ScheduleResult(scheduler.name, jobs, allocate=False)
+        for name in RESULT_COLUMNS:
+            setattr(result, name, columns[name])
+        result.core = columns.get('core')
+        entry['lastUsed'] = time.time()
+        self.index['hits'] += 1
+        self._save()
+        return result
+
+    def put(self, tracePath, scheduler, result):
+        """Store ``result`` for ``scheduler`` on the trace, then evict down to ``maxBytes``."""
+        key = self.key(tracePath, scheduler)
+        names = list(JOB_COLUMNS) + list(RESULT_COLUMNS)
+        columns = [getattr(result.jobs, name) for name in JOB_COLUMNS] + \
+                  [getattr(result, name) for name in RESULT_COLUMNS]
+        if result.core is not None:
+            names.append('core')
+            columns.append(result.core)
+        path = self._entry_path(key)
+        resultfile.write_results(path, names, iter_chunks(columns), len(result))
+        self.index['entries'][key] = {
+            'trace': os.path.abspath(tracePath),
+            'digest': self.digest(tracePath),
+            'scheduler': repr(scheduler),
+            'bytes': os.path.getsize(path),
+            'lastUsed': time.time(),
+            'summary': result.summary(),
+        }
+        self._evict()
+        self._save()
+
+    def run(self, tracePath, scheduler, engine=None):
+        """Return the cached result for ``scheduler`` on the trace, running and storing it on a miss.
+
+        ``engine(jobs)``, when given, computes the result on a miss instead of
+        ``scheduler.run``; it must produce the same schedule (e.g. ``fcfs_numpy``).
+        """
+        result = self.get(tracePath, scheduler)
+        if result is None:
+            jobs = load_jobs(tracePath)
+            result = engine(jobs) if engine is not None else scheduler.run(jobs)
+            self.put(tracePath, scheduler, result)
+        return result
+
+    def summary(self, tracePath, scheduler):
+        """The stored summary of a cached run, without loading its columns, or None."""
+        entry = self.index['entries'].get(self.key(tracePath, scheduler))
+        return entry['summary'] if entry else None
+
+    def _evict(self):
+        # drop the least recently used entries until the total size fits
+        entries = self.index['entries']
+        total = sum(entry['bytes'] for entry in entries.values())
+        for key in sorted(entries, key=lambda k: entries[k]['lastUsed']):
+            if total <= self.maxBytes:
+                break
+            total -= entries[key]['bytes']
+            self._remove(key)
+            self.index['evictions'] += 1
+
+    def _remove(self, key):
+        del self.index['entries'][key]
+        try:
+            os.remove(self._entry_path(key))
+        except FileNotFoundError:
+            pass
+
+    def invalidate(self, tracePath=None):
+        """Drop the entries for one trace (all of them when ``tracePath`` is None); returns how many."""
+        entries = self.index['entries']
+        if tracePath is None:
+            keys = list(entries)
+            self.index['digests'].clear()
+        else:
+            path = os.path.abspath(tracePath)
+            keys = [key for key, entry in entries.items() if entry['trace'] == path]
+            self.index['digests'].pop(path, None)
+        for key in keys:
+            self._remove(key)
+        self._save()
+        return len(keys)
+
+    def stats(self):
+        entries = self.index['entries']
+        return {
+            'entries': len(entries),
+            'bytes': sum(entry['bytes'] for entry in entries.values()),
+            'maxBytes': self.maxBytes,
+            'hits': self.index['hits'],
+            'misses': self.index['misses'],
+            'evictions': self.index['evictions'],
+        }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m cpusim.cache', description=__doc__.splitlines()[0])
+    parser.add_argument("--dir", default=DEFAULT_DIR, help="Cache directory (default: $CPUSIM_CACHE_DIR or ~/.cache/cpusim)")
+    commands = parser.add_subparsers(dest='command', required=True)
+    commands.add_parser('info', help='Print the cache size and hit/miss counters')
+    commands.add_parser('clear', help='Remove every cached run')
+    invalidate = commands.add_parser('invalidate', help='Remove the cached runs of one trace')
+    invalidate.add_argument('trace', help='Trace whose runs are dropped')
+    args = parser.parse_args(argv)
+
+    cache = ResultCache(args.dir)
+    if args.command == 'info':
+        for name, value in cache.stats().items():
+            print(f"{name}: {value}")
+        for entry in cache.index['entries'].values():
+            print(f"  {entry['scheduler']} on {entry['trace']} ({entry['bytes']} bytes)")
+    elif args.command == 'clear':
+        print(f"Removed {cache.invalidate()} cached runs")
+    else:
+        print(f"Removed {cache.invalidate(args.trace)} cached runs of {args.trace}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""A Completely Fair Scheduler in the style of Linux CFS.
+
+Every job has a weight (1024 for nice 0, see ``NICE_TO_WEIGHT``) and a
+virtual runtime that advances by the time it runs scaled by
+``NICE_0_WEIGHT / weight``, so heavier jobs age more slowly. The job with
+the smallest virtual runtime runs next, for a slice of the scheduling
+period in proportion to its share of the runnable weight. The period is
+``targetLatency``, stretched to ``runnable * minGranularity`` when there
+are more runnable jobs than ``targetLatency / minGranularity``, and no
+slice is shorter than ``minGranularity``. New jobs start at the smallest
+virtual runtime seen, so they neither starve nor monopolize the CPU.
+
+As in Linux the running job is kept outside the ordered structure, and a
+waiting job's key never changes, so a binary heap gives the O(log n)
+pick-minimum and insert of the red-black tree. Decisions happen at slice
+boundaries (there is no wakeup preemption), and every expired slice
+counts as a context switch, as in Round Robin.
+"""
+
+import csv
+import heapq
+from array import array
+
+from .engine import Policy
+from .jobs import int_column, int_view
+from .scheduler import Scheduler
+
+NICE_0_WEIGHT = 1024
+# Linux's sched_prio_to_weight: the weight of nice -20 through 19, about 1.25x per step
+NICE_TO_WEIGHT = (
+    88761, 71755, 56483, 46273, 36291, 29154, 23254, 18705, 14949, 11916,
+    9548, 7620, 6100, 4904, 3906, 3121, 2501, 1991, 1586, 1277,
+    1024, 820, 655, 526, 423, 335, 272, 215, 172, 137,
+    110, 87, 70, 56, 45, 36, 29, 23, 18, 15,
+)
+# virtual runtimes are kept in 1/65536 time units so light and heavy weights stay exact enough
+VRUNTIME_SHIFT = 16
+
+
+def weight_of_nice(nice):
+    """The CFS weight of a nice value from -20 to 19."""
+    if not -20 <= nice <= 19:
+        raise ValueError(f"nice must be between -20 and 19, not {nice}")
+    return NICE_TO_WEIGHT[nice + 20]
+
+
+def load_weights(path):
+    """Read per-job weights from a CSV with an ``Index,Weight`` or ``Index,Nice`` header; returns ``{index: weight}``."""
+    weights = {}
+    with open(path, 'r', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        nice = header is not None and len(header) > 1 and header[1].strip().lower() == 'nice'
+        for row in reader:
+            if not row:
+                continue
+            if len(row) < 2:
+                raise ValueError(f"line {reader.line_num} has no weight")
+            value = int(row[1])
+            weight = weight_of_nice(value) if nice else value
+            if weight <= 0:
+                raise ValueError(f"Job {row[0]} has weight {weight}; weights must be positive")
+            weights[int(row[0])] = weight
+    return weights
+
+
+def weight_column(jobs, weights):
+    """Per-job weights aligned with ``jobs``: ``weights[index]``, or ``NICE_0_WEIGHT`` for jobs it leaves out."""
+    if weights is None:
+        return int_column(len(jobs), NICE_0_WEIGHT)
+    get = weights.get
+    return array('q', [get(index, NICE_0_WEIGHT) for index in int_view(jobs.index)])
+
+
+def weights_key(weights):
+    # a short digest of the weights for the scheduler repr, which keys the run cache and checkpoints
+    if weights is None:
+        return 'None'
+    import hashlib
+    return hashlib.sha256(repr(sorted(weights.items())).encode('utf-8')).hexdigest()[:16]
+
+
+class FairPolicy(Policy):
+    """Waiting jobs sit in a heap of ``(vruntime, sequence, index)``; the running job is kept outside it."""
+
+    def __init__(self, weight, targetLatency, minGranularity):
+        self.weight = weight
+        self.targetLatency = targetLatency
+        self.minGranularity = minGranularity
+        self.crowded = targetLatency // minGranularity   # runnable jobs beyond which the period stretches
+        self.tree = []
+        self.sequence = 0           # insertion count, so equal virtual runtimes run first in, first out
+        self.minVruntime = 0
+        self.totalWeight = 0        # weight of the runnable jobs, including the running one
+        self.runnable = 0
+        self.current = -1
+        self.currentVruntime = 0
+        self.currentSlice = 0
+
+    def admit(self, order, start, stop):
+        tree = self.tree
+        weight = self.weight
+        vruntime = self.minVruntime
+        sequence = self.sequence
+        totalWeight = self.totalWeight
+        for i in range(start, stop):
+            j = order[i]
+            heapq.heappush(tree, (vruntime, sequence, j))
+            sequence += 1
+            totalWeight += weight[j]
+        self.sequence = sequence
+        self.totalWeight = totalWeight
+        self.runnable += stop - start
+
+    def next_job(self, clock):
+        current = self.current
+        if current >= 0:
+            # the job on the CPU was not requeued, so it has finished
+            self.totalWeight -= self.weight[current]
+            self.runnable -= 1
+        if not self.tree:
+            self.current = -1
+            return -1
+        vruntime, _, j = heapq.heappop(self.tree)
+        self.current = j
+        self.currentVruntime = vruntime
+        if vruntime > self.minVruntime:
+            self.minVruntime = vruntime
+        return j
+
+    def quantum_of(self, j):
+        runnable = self.runnable
+        minGranularity = self.minGranularity
+        period = self.targetLatency if runnable <= self.crowded else runnable * minGranularity
+        length = period * self.weight[j] // self.totalWeight
+        if length < minGranularity:
+            length = minGranularity
+        self.currentSlice = length
+        return length
+
+    def requeue(self, j, remaining):
+        vruntime = self.currentVruntime + (self.currentSlice * NICE_0_WEIGHT << VRUNTIME_SHIFT) // self.weight[j]
+        heapq.heappush(self.tree, (vruntime, self.sequence, j))
+        self.sequence += 1
+        self.current = -1
+
+    def state(self):
+        return (self.tree, self.sequence, self.minVruntime, self.totalWeight, self.runnable,
+                self.current, self.currentVruntime, self.currentSlice)
+
+    def restore(self, state):
+        (self.tree, self.sequence, self.minVruntime, self.totalWeight, self.runnable,
+         self.current, self.currentVruntime, self.currentSlice) = state
+
+
+class CompletelyFair(Scheduler):
+    """CFS with per-job ``weights`` (``{index: weight}``, default ``NICE_0_WEIGHT`` for every job)."""
+
+    name = 'cfs'
+
+    def __init__(self, targetLatency=200, minGranularity=25, weights=None):
+        if minGranularity <= 0 or targetLatency < minGranularity:
+            raise ValueError("minGranularity must be positive and no longer than targetLatency")
+        self.targetLatency = targetLatency
+        self.minGranularity = minGranularity
+        self.weights = weights
+
+    def __repr__(self):
+        return (f"CompletelyFair(targetLatency={self.targetLatency}, minGranularity={self.minGranularity}, "
+                f"weights={weights_key(self.weights)})")
+
+    def policy(self, jobs):
+        return FairPolicy(weight_column(jobs, self.weights), self.targetLatency, self.minGranularity)
+
+
+def cfs(jobs, targetLatency=200, minGranularity=25, weights=None):
+    """Run the Completely Fair Scheduler over ``jobs``."""
+    return CompletelyFair(targetLatency, minGranularity, weights).run(jobs)
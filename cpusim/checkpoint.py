@@ -0,0 +1,136 @@
+"""Checkpoint and resume of scheduler runs over append-only traces.
+
+A :class:`Checkpoint` saves the state of the discrete-event core at the
+moment the last job of the trace has been admitted: the clock, the running
+job and its slice, the remaining times, the arrival cursor, the policy's
+ready queue or heap and the per-job result columns. Jobs appended to the
+trace afterwards arrive later, so a full run over the longer trace would
+make the same decisions up to that point. The next run therefore resumes
+from the checkpoint and only simulates the jobs that were still in the
+system and the new tail, then saves a new checkpoint.
+
+A checkpoint is only used when the trace still starts with the exact bytes
+it covered (checked by SHA-256) and every appended job arrives after its
+``horizon``: the checkpoint's clock and every earlier arrival. Otherwise
+the run starts from time 0. The saved columns of the earlier jobs are
+still loaded and written out in full, but at array copy speed rather than
+one simulated event at a time. Binary traces (:mod:`cpusim.tracefile`)
+are written whole rather than appended to, so :meth:`Checkpoint.run`
+rejects them with a ValueError.
+
+Checkpoints are pickles, so only resume from checkpoints you wrote::
+
+    python -m cpusim rr --data arrivals.csv --out arrivals_rr.csv --checkpoint arrivals_rr.ckpt
+"""
+
+import hashlib
+import os
+import pickle
+
+from . import tracefile
+from .engine import simulate
+from .jobs import Jobs, read_jobs
+from .scheduler import Scheduler
+
+# bump whenever a change to the engine or the policies alters the saved state
+CHECKPOINT_VERSION = 2
+MAGIC = 'cpusim-checkpoint'
+
+
+def prefix_digest(path, numBytes):
+    """SHA-256 of the first ``numBytes`` bytes of a file, read in 1 MiB blocks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        while numBytes > 0:
+            block = f.read(min(numBytes, 1 << 20))
+            if not block:
+                break
+            digest.update(block)
+            numBytes -= len(block)
+    return digest.hexdigest()
+
+
+def _read_trace(path, offset):
+    # the jobs from byte 'offset' on (past the header when 0), and the size of the trace read
+    with open(path, 'rb') as f:
+        if offset:
+            f.seek(offset)
+        else:
+            f.readline()  # skip the header row
+        jobs = read_jobs(f)
+        return jobs, f.tell()
+
+
+class Checkpoint:
+    """The saved engine state of one scheduler over a CSV trace, kept at ``path``.
+
+    ``resumed`` is the number of jobs the last :meth:`run` took from the
+    checkpoint instead of simulating them from time 0.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.resumed = 0
+
+    def load(self, tracePath, scheduler):
+        """The saved checkpoint, or None when it is missing or does not cover a prefix of the trace."""
+        try:
+            with open(self.path, 'rb') as f:
+                saved = pickle.load(f)
+        except (OSError, EOFError, ValueError, pickle.UnpicklingError):
+            return None
+        if not isinstance(saved, dict) or saved.get('magic') != MAGIC or \
+                saved.get('version') != CHECKPOINT_VERSION or saved.get('scheduler') != repr(scheduler):
+            return None
+        traceBytes = saved['traceBytes']
+        if not saved['endsWithNewline'] or os.path.getsize(tracePath) < traceBytes or \
+                prefix_digest(tracePath, traceBytes) != saved['digest']:
+            return None
+        return saved
+
+    def run(self, tracePath, scheduler):
+        """Run ``scheduler`` over the trace, resuming from the checkpoint when it can, and save a new one."""
+        if type(scheduler).policy is Scheduler.policy:
+            raise ValueError(f"{scheduler!r} does not run on the discrete-event core and cannot be checkpointed")
+        if tracefile.is_trace_file(tracePath):
+            raise ValueError("Checkpoints need an append-only CSV trace, not a binary trace")
+
+        saved = self.load(tracePath, scheduler)
+        resume = None
+        if saved is not None:
+            tail, traceBytes = _read_trace(tracePath, saved['traceBytes'])
+            if not len(tail) or min(tail.arrival) > saved['horizon']:
+                jobs = Jobs(saved['index'] + tail.index, saved['arrival'] + tail.arrival, saved['size'] + tail.size)
+                resume = saved['engine']
+        if resume is None:
+            jobs, traceBytes = _read_trace(tracePath, 0)
+            if not len(jobs):
+                raise ValueError("The input CSV has no data rows")
+        self.resumed = len(saved['index']) if resume is not None else 0
+
+        with open(tracePath, 'rb') as f:
+            f.seek(traceBytes - 1)
+            endsWithNewline = f.read(1) == b'\n'
+        digest = prefix_digest(tracePath, traceBytes)
+
+        def save(state):
+            # called while the run is paused, so the live columns are pickled as they are now
+            checkpoint = {
+                'magic': MAGIC,
+                'version': CHECKPOINT_VERSION,
+                'scheduler': repr(scheduler),
+                'traceBytes': traceBytes,
+                'digest': digest,
+                'endsWithNewline': endsWithNewline,
+                'horizon': max(state['clock'], max(jobs.arrival)),
+                'index': jobs.index,
+                'arrival': jobs.arrival,
+                'size': jobs.size,
+                'engine': state,
+            }
+            temporary = self.path + '.tmp'
+            with open(temporary, 'wb') as f:
+                pickle.dump(checkpoint, f, pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary, self.path)
+
+        return simulate(scheduler.policy(jobs), jobs, scheduler.name, resume, save)
@@ -0,0 +1,250 @@
+"""The ``cpusim`` command line: ``python -m cpusim <command> [options]``.
+
+The algorithm commands ``fcfs``, ``sjf``, ``stcf``, ``rr``, ``mlfq``,
+``cfs`` and ``stride`` take the same options as the scripts in
+``Algorithms/``, which are thin wrappers around them. The other commands
+(``generate``, ``live``, ``sweep``, ``cache``, ``tracefile``,
+``resultfile`` and ``timeline``) hand over to the command line of the
+module they name.
+
+Startup is kept small: importing ``cpusim`` loads the job and result
+columns and every scheduler module (all standard library, and a few
+milliseconds together), while the optional features (multi-core, the
+run cache, the binary results format, NumPy) are only imported when
+their flags ask for them. Measure it with::
+
+    python -X importtime -m cpusim rr --data Data/Job2.csv --out job2_rr.csv 2> importtime.txt
+"""
+
+import argparse
+import importlib
+import sys
+
+# default input and output, and the output layout, of each algorithm command
+ALGORITHMS = {
+    'fcfs': {'data': 'job1.csv', 'out': None, 'layout': 'fcfs'},
+    'sjf': {'data': 'job1.csv', 'out': 'job1_sjf.csv', 'layout': 'sjf'},
+    'stcf': {'data': 'Job2.csv', 'out': None, 'layout': 'stcf'},
+    'rr': {'data': 'Job2.csv', 'out': 'job2_rr.csv', 'layout': 'rr'},
+    'mlfq': {'data': 'Job2.csv', 'out': 'job2_mlfq.csv', 'layout': 'rr'},
+    'cfs': {'data': 'Job2.csv', 'out': 'job2_cfs.csv', 'layout': 'rr'},
+    'stride': {'data': 'Job2.csv', 'out': 'job2_stride.csv', 'layout': 'rr'},
+}
+
+# commands that hand over to the main(argv) of another module
+TOOLS = {
+    'generate': 'cpusim.generators',
+    'live': 'cpusim.live',
+    'sweep': 'cpusim.sweep',
+    'cache': 'cpusim.cache',
+    'tracefile': 'cpusim.tracefile',
+    'resultfile': 'cpusim.resultfile',
+    'timeline': 'cpusim.timeline',
+}
+
+
+def _quanta(text):
+    # --quanta: one positive integer per level
+    try:
+        quanta = [int(q) for q in text.split(',')]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected comma-separated integers, not {text!r}") from None
+    if min(quanta) <= 0:
+        raise argparse.ArgumentTypeError("every quantum must be positive")
+    return quanta
+
+
+def _positive_int(text):
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected an integer, not {text!r}") from None
+    if value <= 0:
+        raise argparse.ArgumentTypeError("must be positive")
+    return value
+
+
+def _weights(path):
+    # --weights: the {index: weight} dict, loaded here so a bad file is a usage error
+    from .cfs import load_weights
+    try:
+        return load_weights(path)
+    except OSError as e:
+        raise argparse.ArgumentTypeError(f"cannot read {path}: {e.strerror}") from None
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(f"{path}: {e}") from None
+
+
+def build_parser(algorithm, prog=None):
+    """The option parser of one algorithm command."""
+    defaults = ALGORITHMS[algorithm]
+    parser = argparse.ArgumentParser(prog=prog)
+    if algorithm == 'fcfs':
+        parser.add_argument("--data", help="Path to input CSV ('-' for stdin, implies --stream)", default=defaults['data'])
+        parser.add_argument("--out", default=None, help="Optional output file ('-' for stdout)")
+        parser.add_argument("--stream", action="store_true", help="Single-pass, constant-memory mode for arrival-sorted input")
+        parser.add_argument("--vectorized", action="store_true", help="Compute the schedule with the NumPy kernel")
+    else:
+        parser.add_argument("--data", help="Path to input CSV", default=defaults['data'])
+        parser.add_argument("--out", help="Path to output CSV", default=defaults['out'])
+    if algorithm in ('rr', 'stride'):
+        parser.add_argument("--quantum", type=_positive_int, default=50, help="Time quantum")
+    if algorithm == 'mlfq':
+        parser.add_argument("--quanta", type=_quanta, default="10,20,40", help="Comma-separated quantum per level, top level first")
+        parser.add_argument("--boost", type=int, default=1000, help="Priority boost period (0 disables boosting)")
+    if algorithm == 'cfs':
+        parser.add_argument("--latency", type=_positive_int, default=200, help="Target latency: the period in which every runnable job runs once")
+        parser.add_argument("--min-granularity", type=_positive_int, default=25, help="Shortest slice a job is given")
+    if algorithm in ('cfs', 'stride'):
+        parser.add_argument("--weights", type=_weights, default=None, help="CSV of per-job weights (Index,Weight or Index,Nice); unlisted jobs weigh 1024 (nice 0)")
+    if algorithm in ('fcfs', 'sjf', 'stcf', 'rr'):
+        parser.add_argument("--cores", type=int, default=1, help="Number of CPUs to simulate")
+    if algorithm in ('fcfs', 'sjf', 'rr'):
+        parser.add_argument("--work-stealing", action="store_true", help="Per-core ready queues with work stealing (with --cores)")
+    parser.add_argument("--format", choices=("csv", "binary"), default="csv", help="Write CSV, or the columnar binary results format")
+    parser.add_argument("--no-footer", action="store_true", help="Leave the averages row out of the CSV")
+    parser.add_argument("--summary", default=None, help="Also write the averages as JSON to this path")
+    parser.add_argument("--stats", action="store_true", help="Print mean, p50/p95/p99, max and fairness of response and turnaround time")
+    parser.add_argument("--cache", action="store_true", help="Reuse the cached run of the same trace and parameters, or cache this one (see python -m cpusim.cache)")
+    parser.add_argument("--checkpoint", default=None, help="Resume from the engine state saved at this path when the trace has only grown since, then save this run's state there")
+    parser.add_argument("--timeline", default=None, help="Record every CPU slice, coalesced per job, to this side file (.csv, or the indexed binary format of python -m cpusim.timeline)")
+    parser.add_argument("--report", default=None, help="Write a JSON report of phase timings and scheduling counters to this path")
+    parser.add_argument("--profile", default=None, help="Profile the run with cProfile and write the pstats dump to this path")
+    return parser
+
+
+def _scheduler(algorithm, args, multiCore):
+    if multiCore:
+        from .multicore import MultiCore
+        return MultiCore(algorithm, args.cores, getattr(args, 'quantum', 50), getattr(args, 'work_stealing', False))
+    from . import SCHEDULERS
+    if algorithm == 'rr':
+        return SCHEDULERS['rr'](args.quantum)
+    if algorithm == 'mlfq':
+        return SCHEDULERS['mlfq'](args.quanta, args.boost or None)
+    if algorithm == 'cfs':
+        return SCHEDULERS['cfs'](args.latency, args.min_granularity, args.weights)
+    if algorithm == 'stride':
+        return SCHEDULERS['stride'](args.quantum, args.weights)
+    return SCHEDULERS[algorithm]()
+
+
+def run_algorithm(algorithm, argv=None, prog=None):
+    """Parse ``argv`` for one algorithm command and run it."""
+    parser = build_parser(algorithm, prog)
+    args = parser.parse_args(argv)
+    from .instrument import Instrumentation
+
+    input_file_name = args.data
+    # fcfs and stcf name their output after the input
+    if args.out:
+        output_file_name = args.out
+    elif input_file_name == '-':
+        output_file_name = '-'
+    else:
+        output_file_name = input_file_name.split('.')[0] + f"_{algorithm}.csv"
+    if getattr(args, 'cores', 1) < 1:
+        parser.error("--cores must be at least 1")
+    if getattr(args, 'boost', 0) < 0:
+        parser.error("--boost must be positive, or 0 to disable boosting")
+    if algorithm == 'cfs' and args.min_granularity > args.latency:
+        parser.error("--min-granularity cannot be longer than --latency")
+    multiCore = getattr(args, 'cores', 1) > 1 or getattr(args, 'work_stealing', False)
+    streaming = algorithm == 'fcfs' and (args.stream or '-' in (input_file_name, output_file_name))
+    if algorithm == 'fcfs' and multiCore and (streaming or args.vectorized):
+        parser.error("--cores and --work-stealing cannot be combined with streaming or --vectorized")
+    if streaming and args.format == "binary":
+        parser.error("--format binary cannot be combined with streaming")
+    if streaming and args.cache:
+        parser.error("--cache cannot be combined with streaming")
+    if args.checkpoint and (multiCore or streaming or args.cache or getattr(args, 'vectorized', False)):
+        parser.error("--checkpoint cannot be combined with --cores, --work-stealing, --cache, streaming or --vectorized")
+    if args.checkpoint:
+        from .tracefile import is_trace_file
+        if is_trace_file(input_file_name):
+            parser.error("--checkpoint needs an append-only CSV trace, not a binary trace")
+    if args.timeline and (streaming or args.cache or args.checkpoint or getattr(args, 'vectorized', False)):
+        parser.error("--timeline cannot be combined with --cache, --checkpoint, streaming or --vectorized")
+
+    instruments = Instrumentation(count=args.report is not None, profile=args.profile is not None)
+    if streaming:
+        from .streaming import stream_fcfs
+        infile = sys.stdin if input_file_name == '-' else open(input_file_name, 'r', newline='')
+        outfile = sys.stdout if output_file_name == '-' else open(output_file_name, 'w', newline='')
+        try:
+            with instruments.phase('stream'):
+                summary = stream_fcfs(infile, outfile, footer=not args.no_footer)
+        except ValueError as e:
+            parser.error(str(e))
+        finally:
+            if infile is not sys.stdin:
+                infile.close()
+            if outfile is not sys.stdout:
+                outfile.close()
+    else:
+        scheduler = _scheduler(algorithm, args, multiCore)
+        engine = None
+        if algorithm == 'fcfs' and args.vectorized:
+            # the NumPy kernel computes the same schedule, so it shares the cached runs
+            from .fcfs import fcfs_numpy as engine
+        if args.cache:
+            from .cache import ResultCache
+            with instruments.phase('cache'):
+                result = ResultCache().run(input_file_name, scheduler,
+                                           lambda jobs: instruments.run(scheduler, jobs, engine))
+        elif args.checkpoint:
+            from .checkpoint import Checkpoint
+            with instruments.phase('resume'):
+                result = Checkpoint(args.checkpoint).run(input_file_name, scheduler)
+        else:
+            from .jobs import load_jobs
+            with instruments.phase('parse'):
+                jobs = load_jobs(input_file_name)
+            with instruments.phase('simulate'):
+                if args.timeline:
+                    from .timeline import TimelineWriter
+                    with TimelineWriter(args.timeline, jobs.index) as timeline:
+                        result = instruments.run(scheduler, jobs, engine, timeline)
+                else:
+                    result = instruments.run(scheduler, jobs, engine)
+        with instruments.phase('write'):
+            if args.format == "binary":
+                from .output import write_binary
+                write_binary(result, output_file_name, ALGORITHMS[algorithm]['layout'])
+            else:
+                from .output import write_csv
+                write_csv(result, output_file_name, ALGORITHMS[algorithm]['layout'], footer=not args.no_footer)
+        summary = result.summary() if args.summary or args.stats else None
+
+    if args.summary:
+        from .output import write_summary
+        write_summary(summary, args.summary)
+    if args.stats:
+        from .stats import format_report
+        print(format_report(summary), file=sys.stderr if output_file_name == '-' else sys.stdout)
+    instruments.save(args.report, args.profile)
+    if args.format == "binary":
+        print(f"Binary result file written. Output saved to {output_file_name}")
+    elif algorithm == 'fcfs':
+        # keep stdout clean when it carries the CSV
+        print("CSV file processed successfully.", file=sys.stderr if output_file_name == '-' else sys.stdout)
+    else:
+        print(f"CSV file processed successfully. Output saved to {output_file_name}")
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    command = argv[0] if argv else None
+    if command in ALGORITHMS:
+        run_algorithm(command, argv[1:], prog=f'python -m cpusim {command}')
+    elif command in TOOLS:
+        importlib.import_module(TOOLS[command]).main(argv[1:])
+    else:
+        usage = ("usage: python -m cpusim <command> [options]\n\n"
+                 f"algorithms: {', '.join(ALGORITHMS)}\n"
+                 f"tools:      {', '.join(TOOLS)}\n\n"
+                 "Run 'python -m cpusim <command> --help' for the options of a command.")
+        if command in ('-h', '--help'):
+            print(usage)
+        else:
+            sys.exit(usage if command is None else f"Unknown command {command!r}\n\n{usage}")
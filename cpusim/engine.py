@@ -0,0 +1,249 @@
+"""The discrete-event core shared by the single-CPU schedulers.
+
+There are three kinds of event: an arrival, a completion and a quantum
+expiry. At equal times a completion is handled before an arrival, and an
+arrival before a quantum expiry, so a job that arrives as a slice ends is
+queued ahead of the job that used up its quantum. The clock always jumps
+straight to the next event; nothing is polled.
+
+With one CPU there are only two event sources, both already in time
+order: the arrival-sorted job cursor and the running job, whose
+completion or quantum expiry sits in a single slot (as the running job in
+STCF sits outside the ready heap). Picking the next event is therefore one
+comparison instead of a heap push and pop, and a preemption simply
+overwrites the slot. Arrivals are only events while the CPU is idle or the
+policy is preemptive; otherwise the arrivals that happened during a slice
+reach the policy in one batch when the slice ends.
+
+Everything algorithm-specific lives in a :class:`Policy`, created per run
+by :meth:`Scheduler.policy <cpusim.scheduler.Scheduler.policy>`.
+
+Once the last job has been admitted, only arrivals that come later can
+change the rest of the schedule. :func:`simulate` can hand the engine state
+at that point to a ``checkpoint`` callback, and a later run over the same
+jobs plus jobs that arrive afterwards can ``resume`` from it instead of
+starting at time 0 (see :mod:`cpusim.checkpoint`).
+"""
+
+from array import array
+from operator import sub
+
+from .jobs import int_column, int_view
+from .results import ScheduleResult, NEW, READY, DONE
+
+# event kinds, in the order they are handled at equal times
+COMPLETION, ARRIVAL, QUANTUM_EXPIRY = 0, 1, 2
+
+INFINITY = float('inf')
+
+
+class Policy:
+    """Decision logic for one run of :func:`simulate`.
+
+    ``admit`` receives the jobs ``order[start:stop]`` that have arrived,
+    where ``order`` is the arrival order, so a job's position there is its
+    arrival rank. ``next_job`` returns the job to dispatch, or -1 when
+    nothing is ready. A job runs for ``quantum`` time units, or
+    ``quantum_of(j)`` when that is set, or to completion when both are
+    ``None``. A job that used its whole quantum, or was preempted, goes
+    back through ``requeue`` with the work it has left. Preemptive
+    policies are asked ``preempts(remaining)`` after every arrival batch.
+    ``firstJob``, when set, is dispatched at its arrival time before any
+    other job is admitted, and is requeued after its first slice ahead of
+    the jobs that arrived during it. ``state`` and ``restore`` save and
+    reload the ready structure for checkpoints.
+    """
+
+    preemptive = False
+    quantum = None
+    quantum_of = None
+    firstJob = None
+
+    def admit(self, order, start, stop):
+        raise NotImplementedError
+
+    def next_job(self, clock):
+        raise NotImplementedError
+
+    def requeue(self, j, remaining):
+        raise NotImplementedError
+
+    def preempts(self, remaining):
+        return False
+
+    def state(self):
+        """The policy's ready structure, as picklable values; it may be live, so pickle it before the run continues."""
+        raise NotImplementedError(f"{type(self).__name__} cannot be checkpointed")
+
+    def restore(self, state):
+        """Load a ``state()`` saved by a run over a prefix of this run's jobs."""
+        raise NotImplementedError(f"{type(self).__name__} cannot be checkpointed")
+
+
+def simulate(policy, jobs, name, resume=None, checkpoint=None, timeline=None):
+    """Run ``policy`` over ``jobs`` on one CPU and return the :class:`ScheduleResult`.
+
+    ``checkpoint(state)``, when given, is called once, as soon as every job
+    has been admitted, with a dict of the engine state. Its values are the
+    live columns and ready structure, so it must be pickled or copied
+    before the callback returns. ``resume`` is such a state from a run over
+    the first jobs of ``jobs``; the jobs after them must all arrive later
+    than its ``clock`` and every earlier arrival, and the run then
+    continues from that point. ``timeline``, when given, is a
+    :class:`~cpusim.timeline.TimelineWriter` that receives every slice as
+    it ends.
+    """
+    numJobs = len(jobs)
+    arrivalTime = int_view(jobs.arrival)
+    if resume is None:
+        result = ScheduleResult(name, jobs)
+        remainingTime = array('q', int_view(jobs.size))
+        started = bytearray(numJobs)
+    else:
+        numSaved = len(resume['remainingTime'])
+        extra = numJobs - numSaved
+        result = ScheduleResult(name, jobs, allocate=False)
+        for column in ('firstStart', 'lastStart', 'endTime', 'contextSwitch'):
+            setattr(result, column, resume[column] + int_column(extra))
+        result.jobState = resume['jobState'] + int_column(extra, NEW, 'B')
+        remainingTime = resume['remainingTime'] + array('q', int_view(jobs.size)[numSaved:])
+        started = resume['started'] + bytearray(extra)
+    firstStart = result.firstStart
+    lastStart = result.lastStart
+    endTime = result.endTime
+    jobState = result.jobState
+    contextSwitch = result.contextSwitch
+
+    admit = policy.admit
+    nextJob = policy.next_job
+    requeue = policy.requeue
+    preemptive = policy.preemptive
+    quantum = policy.quantum
+    quantumOf = policy.quantum_of
+
+    firstJob = policy.firstJob
+    if resume is None:
+        order = jobs.arrival_order()
+        if firstJob is not None and numJobs:
+            order.remove(firstJob)
+        # arrival times in arrival order, with a sentinel so the admission loops need no bounds check
+        arrivals = [arrivalTime[j] for j in order]
+        cursor = 0          # first job in 'order' not yet admitted
+    else:
+        # the saved run admitted everything before the cursor, so only the new jobs need ordering
+        cursor = resume['cursor']
+        newJobs = sorted(range(numSaved, numJobs), key=arrivalTime.__getitem__)
+        order = [-1] * cursor + newJobs
+        arrivals = [0] * cursor + [arrivalTime[j] for j in newJobs]
+        policy.restore(resume['policy'])
+    arrivals.append(INFINITY)
+    running = -1            # job on the CPU, or -1 when idle
+    cpuTime = INFINITY      # time and kind of the running job's next event
+    cpuKind = COMPLETION
+    runStart = runSlice = 0
+    clock = 0
+    sliced = quantum is not None or quantumOf is not None
+    leadingSlice = False    # the running slice is firstJob's first one
+    pause = len(order) if checkpoint is not None else -1
+    record = timeline.add if timeline is not None else None
+
+    if resume is not None:
+        clock, running, cpuTime, cpuKind = resume['clock'], resume['running'], resume['cpuTime'], resume['cpuKind']
+        runStart, runSlice, leadingSlice = resume['runStart'], resume['runSlice'], resume['leadingSlice']
+    elif firstJob is not None and numJobs:
+        j = running = firstJob
+        clock = runStart = arrivalTime[j]
+        started[j] = 1
+        firstStart[j] = lastStart[j] = runStart
+        remaining = remainingTime[j]
+        q = quantum if quantumOf is None else quantumOf(j)
+        runSlice = q if sliced and q < remaining else remaining
+        cpuTime = runStart + runSlice
+        cpuKind = COMPLETION if runSlice == remaining else QUANTUM_EXPIRY
+        leadingSlice = True
+
+    while True:
+        if cursor == pause:
+            # every job is admitted; jobs arriving after 'clock' could not have changed anything so far
+            pause = -1
+            checkpoint({
+                'clock': clock, 'cursor': cursor, 'running': running, 'cpuTime': cpuTime, 'cpuKind': cpuKind,
+                'runStart': runStart, 'runSlice': runSlice, 'leadingSlice': leadingSlice,
+                'remainingTime': remainingTime, 'started': started, 'firstStart': firstStart,
+                'lastStart': lastStart, 'endTime': endTime, 'jobState': jobState,
+                'contextSwitch': contextSwitch, 'policy': policy.state(),
+            })
+        # the next event: an arrival (only while it can change a decision) or the running job's
+        nextArrival = arrivals[cursor] if running < 0 or preemptive else INFINITY
+        if nextArrival < cpuTime or (nextArrival == cpuTime and cpuKind == QUANTUM_EXPIRY and running >= 0):
+            clock = nextArrival
+            stop = cursor + 1
+            while arrivals[stop] <= clock:
+                stop += 1
+            admit(order, cursor, stop)
+            cursor = stop
+            if running >= 0:
+                left = remainingTime[running] - (clock - runStart)
+                if policy.preempts(left):
+                    if record is not None:
+                        record(running, runStart, clock)
+                    remainingTime[running] = left
+                    contextSwitch[running] += 1
+                    requeue(running, left)
+                    running = -1
+                    cpuTime = INFINITY
+        elif running >= 0:
+            clock = cpuTime
+            j = running
+            if record is not None:
+                record(j, runStart, clock)
+            if not leadingSlice and arrivals[cursor] <= clock:
+                # jobs that arrived during the slice queue ahead of the job that ran it
+                stop = cursor + 1
+                while arrivals[stop] <= clock:
+                    stop += 1
+                admit(order, cursor, stop)
+                cursor = stop
+            remainingTime[j] -= runSlice
+            running = -1
+            cpuTime = INFINITY
+            if cpuKind == COMPLETION:
+                endTime[j] = clock
+                jobState[j] = DONE
+            else:
+                jobState[j] = READY
+                contextSwitch[j] += 1
+                requeue(j, remainingTime[j])
+            if leadingSlice:
+                leadingSlice = False
+                if arrivals[cursor] <= clock:
+                    stop = cursor + 1
+                    while arrivals[stop] <= clock:
+                        stop += 1
+                    admit(order, cursor, stop)
+                    cursor = stop
+        else:
+            break
+
+        if running < 0:
+            j = nextJob(clock)
+            if j >= 0:
+                running = j
+                runStart = clock
+                lastStart[j] = clock
+                if not started[j]:
+                    started[j] = 1
+                    firstStart[j] = clock
+                remaining = remainingTime[j]
+                if sliced:
+                    q = quantum if quantumOf is None else quantumOf(j)
+                    runSlice = q if q < remaining else remaining
+                else:
+                    runSlice = remaining
+                cpuTime = clock + runSlice
+                cpuKind = COMPLETION if runSlice == remaining else QUANTUM_EXPIRY
+
+    # response and turnaround time follow from the start and end times, so they are filled in bulk
+    result.responseTime = array('q', map(sub, firstStart, arrivalTime))
+    result.turnAroundTime = array('q', map(sub, endTime, arrivalTime))
+    return result
@@ -0,0 +1,82 @@
+"""First Come First Serve: jobs run to completion in order of arrival."""
+
+from collections import deque
+
+from .engine import Policy
+from .results import ScheduleResult, DONE
+from .scheduler import Scheduler
+
+
+class FifoPolicy(Policy):
+    """Jobs run to completion in the order they arrived."""
+
+    def __init__(self):
+        self.queue = deque()
+
+    def admit(self, order, start, stop):
+        self.queue.extend(order[start:stop])
+
+    def next_job(self, clock):
+        return self.queue.popleft() if self.queue else -1
+
+    def state(self):
+        return self.queue
+
+    def restore(self, state):
+        self.queue = state
+
+
+class FirstComeFirstServe(Scheduler):
+
+    name = 'fcfs'
+
+    def policy(self, jobs):
+        return FifoPolicy()
+
+
+def fcfs(jobs):
+    """Run First Come First Serve over ``jobs``."""
+    return FirstComeFirstServe().run(jobs)
+
+
+def fcfs_numpy(jobs):
+    """Run First Come First Serve over ``jobs`` with a vectorized NumPy kernel.
+
+    With ``C`` the running sum of job sizes, ``end[i] = max(end[i-1], arrival[i]) + size[i]``
+    unrolls to ``start[i] = C[i-1] + max(0, max over k <= i of (arrival[k] - C[k-1]))``,
+    which is a cumulative sum plus a running maximum. Unsorted input is
+    stable-sorted by arrival first. The result columns are NumPy arrays.
+    """
+    import numpy as np
+
+    arrival = np.asarray(jobs.arrival, dtype=np.int64)
+    size = np.asarray(jobs.size, dtype=np.int64)
+    order = None
+    if arrival.size > 1 and (arrival[1:] < arrival[:-1]).any():
+        order = np.argsort(arrival, kind='stable')
+        arrival = arrival[order]
+        size = size[order]
+
+    # work queued ahead of each job, and how far its arrival is past that work
+    before = np.cumsum(size) - size
+    start = np.maximum.accumulate(arrival - before)
+    np.maximum(start, 0, out=start)
+    start += before
+
+    if order is not None:
+        # scatter back to input positions
+        unsorted = np.empty_like(start)
+        unsorted[order] = start
+        start = unsorted
+        arrival = np.asarray(jobs.arrival, dtype=np.int64)
+        size = np.asarray(jobs.size, dtype=np.int64)
+
+    result = ScheduleResult(FirstComeFirstServe.name, jobs, allocate=False)
+    result.firstStart = start
+    result.lastStart = start
+    result.endTime = start + size
+    result.responseTime = start - arrival
+    result.turnAroundTime = result.endTime - arrival
+    result.jobState = np.full(len(start), DONE, dtype=np.uint8)
+    result.contextSwitch = np.zeros(len(start), dtype=np.int64)
+    return result
@@ -0,0 +1,181 @@
+"""Seeded, vectorized job trace generators that write in fixed-size chunks.
+
+Distributions are given as ``name:param,param,...`` specs:
+
+* ``normal:MEAN,STD``
+* ``exponential:MEAN``
+* ``uniform:LOW,HIGH`` (inclusive integers)
+* ``constant:VALUE``
+* ``bimodal:P_SMALL,SMALL_MEAN,SMALL_STD,LARGE_MEAN,LARGE_STD`` (mixture of two normals)
+
+Draws are truncated towards zero and clamped at a minimum, matching the
+``int(rand.gauss(...))`` of the original generators. Job sizes, inter-arrival
+gaps and mixture choices come from independent child streams of one
+``numpy.random.SeedSequence``, so a seed produces the same trace whatever
+the chunk size.
+
+Generate a trace from the repository root::
+
+    python -m cpusim generate --preset job2 --jobs 100000000 --seed 42 --out Data/job2_100m.trace
+"""
+
+import argparse
+import os
+
+from .tracefile import HEADER, MAGIC, VERSION, COLUMNS
+
+# the two datasets in Data/: Job1 has steady arrivals, Job2 mixes 80% large and 20% small jobs
+PRESETS = {
+    'job1': {'sizes': 'normal:150,20', 'interarrival': 'normal:75,20', 'minSize': 1},
+    'job2': {'sizes': 'bimodal:0.2,50,10,250,15', 'interarrival': 'normal:75,20', 'minSize': 0},
+}
+
+DEFAULT_CHUNK = 1 << 20
+
+
+class Distribution:
+    """A parsed distribution spec that draws integer samples from NumPy generators."""
+
+    PARAMS = {'normal': 2, 'exponential': 1, 'uniform': 2, 'constant': 1, 'bimodal': 5}
+
+    def __init__(self, spec):
+        name, _, params = spec.partition(':')
+        if name not in self.PARAMS:
+            raise ValueError(f"Unknown distribution {name!r}; expected one of {', '.join(self.PARAMS)}")
+        values = [float(p) for p in params.split(',')] if params else []
+        if len(values) != self.PARAMS[name]:
+            raise ValueError(f"Distribution {name!r} takes {self.PARAMS[name]} parameters, got {len(values)}")
+        if name == 'bimodal' and not 0 <= values[0] <= 1:
+            raise ValueError("The bimodal small-job fraction must be between 0 and 1")
+        self.spec = spec
+        self.name = name
+        self.params = values
+
+    def __repr__(self):
+        return f"Distribution({self.spec!r})"
+
+    def sample(self, streams, n):
+        # 'streams' holds three generators: the values, the second mode and the mixture choice
+        import numpy as np
+
+        values, second, choice = streams
+        p = self.params
+        if self.name == 'normal':
+            draws = values.normal(p[0], p[1], n)
+        elif self.name == 'exponential':
+            draws = values.exponential(p[0], n)
+        elif self.name == 'uniform':
+            return values.integers(int(p[0]), int(p[1]), n, endpoint=True, dtype=np.int64)
+        elif self.name == 'constant':
+            return np.full(n, int(p[0]), dtype=np.int64)
+        else:
+            small = values.normal(p[1], p[2], n)
+            large = second.normal(p[3], p[4], n)
+            draws = np.where(choice.random(n) < p[0], small, large)
+        return draws.astype(np.int64)
+
+
+def generate_chunks(numJobs, sizes, interarrival, seed=None, minSize=0, chunkSize=DEFAULT_CHUNK):
+    """Yield ``(index, arrival, size)`` int64 array chunks of at most ``chunkSize`` jobs.
+
+    Arrival times are the running sum of the inter-arrival gaps (clamped at
+    zero), so the trace is always sorted by arrival.
+    """
+    import numpy as np
+
+    sizes = sizes if isinstance(sizes, Distribution) else Distribution(sizes)
+    interarrival = interarrival if isinstance(interarrival, Distribution) else Distribution(interarrival)
+    streams = [np.random.default_rng(child) for child in np.random.SeedSequence(seed).spawn(6)]
+    sizeStreams, gapStreams = streams[:3], streams[3:]
+
+    clock = 0
+    for first in range(0, numJobs, chunkSize):
+        n = min(chunkSize, numJobs - first)
+        size = np.maximum(sizes.sample(sizeStreams, n), minSize)
+        arrival = np.cumsum(np.maximum(interarrival.sample(gapStreams, n), 0))
+        arrival += clock
+        clock = int(arrival[-1])
+        yield np.arange(first, first + n, dtype=np.int64), arrival, size
+
+
+def write_csv(path, chunks):
+    """Write generated chunks as an ``Index,Arrival Time,Job Size`` CSV. Returns the job count."""
+    import numpy as np
+
+    numJobs = 0
+    with open(path, 'w', newline='') as f:
+        f.write('Index,Arrival Time,Job Size\r\n')
+        for index, arrival, size in chunks:
+            np.savetxt(f, np.column_stack((index, arrival, size)), fmt='%d', delimiter=',', newline='\r\n')
+            numJobs += len(index)
+    return numJobs
+
+
+def write_binary(path, numJobs, chunks):
+    """Write generated chunks as a binary trace (see :mod:`cpusim.tracefile`). Returns the job count."""
+    import numpy as np
+
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, COLUMNS, numJobs))
+        f.truncate(HEADER.size + COLUMNS * 8 * numJobs)
+    columns = np.memmap(path, dtype='<i8', mode='r+', offset=HEADER.size, shape=(COLUMNS, numJobs))
+    written = 0
+    for index, arrival, size in chunks:
+        end = written + len(index)
+        columns[0, written:end] = index
+        columns[1, written:end] = arrival
+        columns[2, written:end] = size
+        columns.flush()  # hand the dirty pages back to the OS after every chunk
+        written = end
+    del columns
+    return written
+
+
+def generate_trace(path, numJobs, preset='job1', sizes=None, interarrival=None, seed=None,
+                   minSize=None, chunkSize=DEFAULT_CHUNK, binary=None):
+    """Generate a trace of ``numJobs`` jobs to ``path``.
+
+    ``sizes``, ``interarrival`` and ``minSize`` override the preset. The
+    binary trace format is used when ``binary`` is true, or by default when
+    ``path`` ends in ``.trace``.
+    """
+    settings = dict(PRESETS[preset])
+    if sizes is not None:
+        settings['sizes'] = sizes
+    if interarrival is not None:
+        settings['interarrival'] = interarrival
+    if minSize is not None:
+        settings['minSize'] = minSize
+    if binary is None:
+        binary = os.path.splitext(path)[1] == '.trace'
+
+    chunks = generate_chunks(numJobs, settings['sizes'], settings['interarrival'], seed,
+                             settings['minSize'], chunkSize)
+    if binary:
+        return write_binary(path, numJobs, chunks)
+    return write_csv(path, chunks)
+
+
+def build_parser(preset='job1', numJobs=1500, out=None):
+    parser = argparse.ArgumentParser(prog='python -m cpusim generate')
+    parser.add_argument("--preset", choices=sorted(PRESETS), default=preset, help="Distribution preset")
+    parser.add_argument("--jobs", type=int, default=numJobs, help="Number of jobs to generate")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed (omit for a fresh trace)")
+    parser.add_argument("--sizes", default=None, help="Job size distribution, e.g. normal:150,20")
+    parser.add_argument("--interarrival", default=None, help="Inter-arrival distribution, e.g. exponential:75")
+    parser.add_argument("--min-size", type=int, default=None, help="Smallest job size to emit")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK, help="Jobs generated per chunk")
+    parser.add_argument("--out", default=out, help="Output path (.trace for the binary format)")
+    return parser
+
+
+def main(argv=None, **defaults):
+    args = build_parser(**defaults).parse_args(argv)
+    output_file_name = args.out or args.preset + ".csv"
+    numJobs = generate_trace(output_file_name, args.jobs, args.preset, args.sizes, args.interarrival,
+                             args.seed, args.min_size, args.chunk_size)
+    print(f"Generated {numJobs} jobs. Output saved to {output_file_name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""Opt-in instrumentation for scheduler runs.
+
+An :class:`Instrumentation` times the phases of a run (parse, simulate,
+write, or anything else named with :meth:`Instrumentation.phase`). It can
+also count what the discrete-event core asks of the policy:
+
+- ``dispatches``: scheduling decisions that put a job on the CPU, including the ``firstJob`` the engine starts itself
+- ``admitted`` and ``admitBatches``: arrivals pushed onto the ready queue, and how many batches they came in
+- ``requeues``: jobs put back after a quantum expiry or a preemption
+- ``preemptions``, and ``preemptionChecks`` (the times a preemptive policy was asked)
+- ``queuePushes`` and ``queuePops``: ready-queue or heap operations
+- ``idleJumps`` and ``idleTime``: times the CPU went idle and the clock jumped to the next arrival (including the
+  jump from time 0 to the first job), and the time skipped
+- ``maxReadyDepth``: the most jobs waiting at once
+
+The counters come from a wrapper around the :class:`~cpusim.engine.Policy`,
+so the engine loop is the same code whether instrumentation is on or
+off. When it is off, :meth:`Instrumentation.run` is just
+``scheduler.run(jobs)``. Schedulers that override ``run`` (the multi-core
+engine) get phase timings only. With ``profile=True`` each phase runs
+under ``cProfile``, and :meth:`Instrumentation.save` dumps the stats for
+``pstats``.
+"""
+
+import time
+from contextlib import contextmanager
+
+from .engine import Policy, simulate
+from .jobs import int_view
+from .scheduler import Scheduler
+
+COUNTERS = ('dispatches', 'admitted', 'admitBatches', 'requeues', 'preemptions', 'preemptionChecks',
+            'queuePushes', 'queuePops', 'idleJumps', 'idleTime', 'maxReadyDepth')
+
+
+class CountingPolicy(Policy):
+    """Wraps a policy and counts the calls the discrete-event core makes to it.
+
+    ``arrivalTime`` is the trace's arrival column, for the start of the run
+    that happens before the engine first calls the policy.
+    """
+
+    def __init__(self, policy, arrivalTime):
+        self.policy = policy
+        self.preemptive = policy.preemptive
+        self.quantum = policy.quantum
+        self.quantum_of = policy.quantum_of
+        self.firstJob = policy.firstJob
+        self.counts = dict.fromkeys(COUNTERS, 0)
+        self.depth = 0
+        self.idleSince = None   # clock at which next_job last found nothing ready
+        if len(arrivalTime):
+            # the engine starts firstJob at its arrival without asking the policy, and otherwise
+            # jumps from time 0 to the first arrival before anything is admitted
+            arrivalTime = int_view(arrivalTime)
+            start = min(arrivalTime) if self.firstJob is None else arrivalTime[self.firstJob]
+            if start > 0:
+                self.counts['idleJumps'] = 1
+                self.counts['idleTime'] = start
+            if self.firstJob is not None:
+                self.counts['dispatches'] = 1
+
+    def admit(self, order, start, stop):
+        counts = self.counts
+        counts['admitted'] += stop - start
+        counts['admitBatches'] += 1
+        counts['queuePushes'] += stop - start
+        if self.idleSince is not None:
+            counts['idleJumps'] += 1
+        self.depth += stop - start
+        if self.depth > counts['maxReadyDepth']:
+            counts['maxReadyDepth'] = self.depth
+        self.policy.admit(order, start, stop)
+
+    def next_job(self, clock):
+        j = self.policy.next_job(clock)
+        counts = self.counts
+        if j < 0:
+            if self.idleSince is None:
+                self.idleSince = clock
+            return j
+        if self.idleSince is not None:
+            counts['idleTime'] += clock - self.idleSince
+            self.idleSince = None
+        counts['dispatches'] += 1
+        counts['queuePops'] += 1
+        self.depth -= 1
+        return j
+
+    def requeue(self, j, remaining):
+        counts = self.counts
+        counts['requeues'] += 1
+        counts['queuePushes'] += 1
+        self.depth += 1
+        if self.depth > counts['maxReadyDepth']:
+            counts['maxReadyDepth'] = self.depth
+        self.policy.requeue(j, remaining)
+
+    def preempts(self, remaining):
+        self.counts['preemptionChecks'] += 1
+        if self.policy.preempts(remaining):
+            self.counts['preemptions'] += 1
+            return True
+        return False
+
+
+class Instrumentation:
+    """Phase timings, policy counters (``count=True``) and a cProfile (``profile=True``) for one run."""
+
+    def __init__(self, count=False, profile=False):
+        self.count = count
+        self.phases = {}
+        self.counters = None
+        self.scheduler = None
+        self.jobs = None
+        self.profiler = None
+        if profile:
+            import cProfile
+            self.profiler = cProfile.Profile()
+
+    @contextmanager
+    def phase(self, name):
+        """Time the enclosed block as phase ``name``, profiling it when enabled."""
+        profiler = self.profiler
+        start = time.perf_counter()
+        if profiler is not None:
+            profiler.enable()
+        try:
+            yield
+        finally:
+            if profiler is not None:
+                profiler.disable()
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - start
+
+    def run(self, scheduler, jobs, engine=None, timeline=None):
+        """Run ``scheduler`` over ``jobs``, counting the policy calls when ``count`` is set.
+
+        ``engine(jobs)``, when given, computes the result instead (e.g.
+        ``fcfs_numpy``); it is timed but not counted. ``timeline`` is passed
+        on to the scheduler.
+        """
+        self.scheduler = scheduler
+        self.jobs = len(jobs)
+        if engine is not None:
+            return engine(jobs)
+        if not self.count or type(scheduler).run is not Scheduler.run:
+            return scheduler.run(jobs, timeline)
+        policy = CountingPolicy(scheduler.policy(jobs), jobs.arrival)
+        result = simulate(policy, jobs, scheduler.name, timeline=timeline)
+        self.counters = policy.counts
+        return result
+
+    def report(self):
+        report = {
+            'scheduler': None if self.scheduler is None else repr(self.scheduler),
+            'jobs': self.jobs,
+            'phases': self.phases,
+            'totalSeconds': sum(self.phases.values()),
+        }
+        if self.counters is not None:
+            report['counters'] = self.counters
+        return report
+
+    def save(self, reportPath=None, profilePath=None):
+        """Write the JSON report and/or the ``pstats`` dump, for each path that is given."""
+        if reportPath:
+            import json
+            with open(reportPath, 'w') as f:
+                json.dump(self.report(), f, indent=2)
+                f.write('\n')
+        if profilePath and self.profiler is not None:
+            self.profiler.dump_stats(profilePath)
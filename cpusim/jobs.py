@@ -0,0 +1,138 @@
+"""Job traces: the ``Index,Arrival Time,Job Size`` columns every scheduler consumes."""
+
+import csv
+import io
+import sys
+from array import array
+from itertools import repeat
+
+HEADER = ['Index', 'Arrival Time', 'Job Size']
+# bytes of CSV lines parsed per block by the plain-integer fast path
+PARSE_BLOCK = 1 << 20
+
+
+def int_view(column):
+    """Return ``column`` in a form whose items index as Python ints.
+
+    NumPy arrays (including memory-mapped traces) are wrapped in a
+    zero-copy ``memoryview``, which the pure-Python engines index much
+    faster than NumPy scalars. Other sequences are returned unchanged.
+    """
+    if hasattr(column, '__array_interface__'):
+        return memoryview(column)
+    return column
+
+
+def little_endian(values):
+    """Byte-swap the ``array`` ``values`` in place on big-endian machines, so the binary formats are little-endian."""
+    if sys.byteorder != 'little':
+        values.byteswap()
+    return values
+
+
+def int_column(numJobs, fill=0, typecode='q'):
+    """A new typed column of ``numJobs`` copies of ``fill``, by default int64.
+
+    An ``array`` stores each value in 8 bytes (1 byte for ``'B'``) instead
+    of a pointer to a boxed int, so it takes a fraction of the memory of a
+    list once the values leave the small-int cache.
+    """
+    return array(typecode, [fill]) * numJobs
+
+
+class Jobs:
+    """An in-memory job array held as three parallel int64 columns."""
+
+    __slots__ = ('index', 'arrival', 'size')
+
+    def __init__(self, index, arrival, size):
+        if not len(index) == len(arrival) == len(size):
+            raise ValueError("Job columns must all have the same length")
+        self.index = index
+        self.arrival = arrival
+        self.size = size
+
+    @classmethod
+    def from_rows(cls, rows):
+        # build the columns from (index, arrival, size) tuples
+        index, arrival, size = array('q'), array('q'), array('q')
+        for idx, arr, sz in rows:
+            index.append(idx)
+            arrival.append(arr)
+            size.append(sz)
+        return cls(index, arrival, size)
+
+    def __len__(self):
+        return len(self.arrival)
+
+    def arrival_order(self):
+        # positions of the jobs sorted by arrival, ties kept in input order
+        arrival = self.arrival
+        if hasattr(arrival, 'argsort'):
+            return arrival.argsort(kind='stable').tolist()
+        return sorted(range(len(arrival)), key=arrival.__getitem__)  # stable, so ties keep input order
+
+
+def _parse_plain(f):
+    # fast path for CSV rows of plain integers, three per row: each block of lines is split and
+    # converted in bulk instead of row by row. Returns None for anything else (quoted fields,
+    # extra columns, blank lines), which then goes through the csv module.
+    index, arrival, size = array('q'), array('q'), array('q')
+    while True:
+        lines = f.readlines(PARSE_BLOCK)
+        if not lines:
+            break
+        if set(map(bytes.count, lines, repeat(b','))) != {2}:
+            return None
+        try:
+            values = array('q', map(int, b''.join(lines).replace(b',', b' ').split()))
+        except ValueError:
+            return None
+        if len(values) != 3 * len(lines):
+            return None
+        index.extend(values[0::3])
+        arrival.extend(values[1::3])
+        size.extend(values[2::3])
+    return Jobs(index, arrival, size)
+
+
+def read_jobs(f):
+    """Read the ``Index,Arrival Time,Job Size`` rows of the binary file ``f``, from its position to the end.
+
+    Plain-integer rows are split and converted in blocks; anything else
+    goes through the ``csv`` module, so ``f`` must be seekable. The header
+    row, if any, must already have been read.
+    """
+    start = f.tell()
+    jobs = _parse_plain(f)
+    if jobs is not None:
+        return jobs
+    f.seek(start)
+    text = io.TextIOWrapper(f, newline='')
+    index, arrival, size = array('q'), array('q'), array('q')
+    for row in csv.reader(text):
+        if not row:
+            continue
+        index.append(int(row[0]))
+        arrival.append(int(row[1]))
+        size.append(int(row[2]))
+    text.detach()  # leave 'f' open for the caller
+    return Jobs(index, arrival, size)
+
+
+def load_jobs(path):
+    """Read a job trace: a CSV with an ``Index,Arrival Time,Job Size`` header, or a binary trace.
+
+    Binary traces (see :mod:`cpusim.tracefile`) are memory-mapped instead of parsed,
+    and CSVs of plain integers are split and converted in blocks.
+    """
+    from . import tracefile
+    if tracefile.is_trace_file(path):
+        return tracefile.load_trace(path)
+
+    with open(path, 'rb') as f:
+        f.readline()  # skip the header row
+        jobs = read_jobs(f)
+    if not len(jobs):
+        raise ValueError("The input CSV has no data rows")
+    return jobs
@@ -0,0 +1,303 @@
+"""Online scheduling of a live job-arrival stream.
+
+:func:`schedule_live` runs FCFS, SJF, STCF or Round Robin over jobs read
+one at a time from a CSV stream (a file, stdin or a local socket), in the
+order they arrive, and writes a completion record as soon as the stream
+shows a job has finished. It drives the same :class:`~cpusim.engine.Policy`
+objects as :func:`cpusim.engine.simulate` and produces the same schedule,
+but only the jobs that have arrived and not yet finished are held in
+memory: their columns are dicts keyed by arrival rank, and a job is
+dropped when its record is written. Memory is therefore bounded by the
+number of jobs in the system, not by the length of the stream.
+
+The input must be in arrival order. Completion records come out in
+completion order, and every ``summaryEvery`` completions a rolling
+summary of the last window is written as one JSON line.
+
+Replay a log through Round Robin from the repository root::
+
+    tail -f arrivals.csv | python -m cpusim.live --algorithm rr --quantum 50 --every 10000 > completions.csv
+    python -m cpusim.live --algorithm stcf --data unix:/tmp/arrivals.sock --out completions.csv
+"""
+
+import argparse
+import csv
+import json
+import socket
+import sys
+
+from . import SCHEDULERS
+from .engine import COMPLETION, QUANTUM_EXPIRY, INFINITY
+from .jobs import Jobs
+from .output import write_summary
+from .scheduler import Scheduler
+from .stats import RunStats
+
+ALGORITHMS = ('fcfs', 'sjf', 'stcf', 'rr')
+HEADER = ['Index', 'Arrival Time', 'Job Size', 'Start Job', 'End Time', 'Response Time',
+          'Turnaround Time', 'Context Switches']
+
+# job ids are arrival ranks, so the arrival order handed to Policy.admit is the identity
+_ORDER = range(sys.maxsize)
+_END = (None, INFINITY, None)
+
+
+def open_input(spec):
+    """Open a job stream: ``-`` for stdin, ``unix:PATH`` or ``tcp:HOST:PORT`` for a socket, else a file."""
+    if spec == '-':
+        return sys.stdin
+    kind, _, address = spec.partition(':')
+    if kind == 'unix':
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(address)
+    elif kind == 'tcp':
+        host, _, port = address.rpartition(':')
+        sock = socket.create_connection((host, int(port)))
+    else:
+        return open(spec, 'r', newline='')
+    # the file keeps the connection open after the socket object is released
+    with sock:
+        return sock.makefile('r', newline='')
+
+
+def _read_jobs(infile):
+    # (index, arrival, size) per row, checking that the stream is in arrival order
+    reader = csv.reader(infile)
+    next(reader, None)  # skip the header row
+    last = None
+    for row in reader:
+        if not row:
+            continue
+        arrival = int(row[1])
+        if last is not None and arrival < last:
+            raise ValueError(f"Job {row[0]} arrives at {arrival}, before the previous job; "
+                             "a live stream must be in arrival order")
+        last = arrival
+        yield int(row[0]), arrival, int(row[2])
+
+
+def _interactive(stream):
+    # pipes, sockets and terminals cannot seek; regular files can
+    try:
+        return not stream.seekable()
+    except (AttributeError, ValueError):
+        return True
+
+
+def schedule_live(scheduler, infile, outfile, summaryEvery=0, summaryFile=None):
+    """Run ``scheduler`` online over the CSV stream ``infile``, writing completion records to ``outfile``.
+
+    ``scheduler`` is a FCFS, SJF, STCF or Round Robin :class:`Scheduler`.
+    When ``infile`` is a pipe or a socket, ``outfile`` is flushed before
+    every read that may block, so the records are visible downstream at
+    once. Every ``summaryEvery`` completions (0 disables it) a rolling
+    summary goes to ``summaryFile`` (default stderr). Returns the summary
+    of the whole run.
+    """
+    if type(scheduler).policy is Scheduler.policy:
+        raise ValueError(f"{scheduler!r} does not run on the discrete-event core and cannot schedule a live stream")
+    if getattr(scheduler, 'name', None) not in ALGORITHMS:
+        raise ValueError(f"Live scheduling supports {', '.join(ALGORITHMS)}, not {scheduler!r}")
+    summaryFile = summaryFile if summaryFile is not None else sys.stderr
+
+    # columns of the jobs in the system, keyed by arrival rank
+    jobs = Jobs({}, {}, {})
+    jobIndex, arrivalTime, jobSize = jobs.index, jobs.arrival, jobs.size
+    remainingTime = {}
+    firstStart = {}
+    contextSwitch = {}
+
+    policy = scheduler.policy(jobs)
+    admit = policy.admit
+    nextJob = policy.next_job
+    requeue = policy.requeue
+    preemptive = policy.preemptive
+    quantum = policy.quantum
+    quantumOf = policy.quantum_of
+    sliced = quantum is not None or quantumOf is not None
+
+    rows = _read_jobs(infile)
+    flushBeforeRead = _interactive(infile)
+    writer = csv.writer(outfile)
+    writer.writerow(HEADER)
+
+    upcoming = None         # next unread job, or _END once the stream is exhausted
+    nextId = 0
+    completed = 0
+    totalResponseTime = totalTurnAroundTime = totalContextSwitches = 0
+    stats = RunStats()
+    window = RunStats() if summaryEvery else None
+
+    def next_arrival():
+        # arrival time of the next job in the stream, reading it if needed
+        nonlocal upcoming
+        if upcoming is None:
+            if flushBeforeRead:
+                outfile.flush()
+            upcoming = next(rows, _END)
+        return upcoming[1]
+
+    def register():
+        # move the upcoming job into the system and return its id
+        nonlocal upcoming, nextId
+        j = nextId
+        jobIndex[j], arrivalTime[j], jobSize[j] = upcoming
+        remainingTime[j] = upcoming[2]
+        contextSwitch[j] = 0
+        upcoming = None
+        nextId += 1
+        return j
+
+    def admit_until(clock):
+        # hand every job that has arrived by 'clock' to the policy as one batch
+        start = nextId
+        while next_arrival() <= clock:
+            register()
+        if nextId > start:
+            admit(_ORDER, start, nextId)
+
+    def complete(j, clock):
+        nonlocal completed, totalResponseTime, totalTurnAroundTime, totalContextSwitches, window
+        arrival = arrivalTime.pop(j)
+        size = jobSize.pop(j)
+        start = firstStart.pop(j)
+        switches = contextSwitch.pop(j)
+        del remainingTime[j]
+        responseTime = start - arrival
+        turnAroundTime = clock - arrival
+        writer.writerow([jobIndex.pop(j), arrival, size, start, clock, responseTime, turnAroundTime, switches])
+        completed += 1
+        totalResponseTime += responseTime
+        totalTurnAroundTime += turnAroundTime
+        totalContextSwitches += switches
+        stats.record(responseTime, turnAroundTime, size)
+        if window is not None:
+            window.record(responseTime, turnAroundTime, size)
+            if completed % summaryEvery == 0:
+                rolling = {'jobs': completed, 'clock': clock, 'inSystem': len(remainingTime),
+                           'averageResponseTime': totalResponseTime / completed,
+                           'averageTurnAroundTime': totalTurnAroundTime / completed,
+                           'window': window.summary()}
+                summaryFile.write(json.dumps(rolling) + '\n')
+                summaryFile.flush()
+                window = RunStats()
+
+    running = -1            # job on the CPU, or -1 when idle
+    cpuTime = INFINITY      # time and kind of the running job's next event
+    cpuKind = COMPLETION
+    runStart = runSlice = 0
+    leadingSlice = False    # the running slice is firstJob's first one
+
+    if policy.firstJob is not None and next_arrival() < INFINITY:
+        # the first job in the stream runs at its arrival, before anything else is admitted
+        j = running = register()
+        runStart = firstStart[j] = arrivalTime[j]
+        remaining = remainingTime[j]
+        q = quantum if quantumOf is None else quantumOf(j)
+        runSlice = q if sliced and q < remaining else remaining
+        cpuTime = runStart + runSlice
+        cpuKind = COMPLETION if runSlice == remaining else QUANTUM_EXPIRY
+        leadingSlice = True
+
+    while True:
+        nextArrival = next_arrival() if running < 0 or preemptive else INFINITY
+        if nextArrival < cpuTime or (nextArrival == cpuTime and cpuKind == QUANTUM_EXPIRY and running >= 0):
+            clock = nextArrival
+            admit_until(clock)
+            if running >= 0:
+                left = remainingTime[running] - (clock - runStart)
+                if policy.preempts(left):
+                    remainingTime[running] = left
+                    contextSwitch[running] += 1
+                    requeue(running, left)
+                    running = -1
+                    cpuTime = INFINITY
+        elif running >= 0:
+            clock = cpuTime
+            j = running
+            running = -1
+            cpuTime = INFINITY
+            if cpuKind == COMPLETION:
+                # the record goes out before the stream is read any further
+                complete(j, clock)
+                admit_until(clock)
+            else:
+                if not leadingSlice:
+                    # jobs that arrived during the slice queue ahead of the job that ran it
+                    admit_until(clock)
+                remainingTime[j] -= runSlice
+                contextSwitch[j] += 1
+                requeue(j, remainingTime[j])
+                if leadingSlice:
+                    admit_until(clock)
+            leadingSlice = False
+        else:
+            break
+
+        if running < 0:
+            j = nextJob(clock)
+            if j >= 0:
+                running = j
+                runStart = clock
+                if j not in firstStart:
+                    firstStart[j] = clock
+                remaining = remainingTime[j]
+                if sliced:
+                    q = quantum if quantumOf is None else quantumOf(j)
+                    runSlice = q if q < remaining else remaining
+                else:
+                    runSlice = remaining
+                cpuTime = clock + runSlice
+                cpuKind = COMPLETION if runSlice == remaining else QUANTUM_EXPIRY
+
+    outfile.flush()
+    if completed == 0:
+        raise ValueError("The input stream has no jobs")
+    summary = {
+        'algorithm': scheduler.name,
+        'jobs': completed,
+        'averageResponseTime': totalResponseTime / completed,
+        'averageTurnAroundTime': totalTurnAroundTime / completed,
+        'contextSwitches': totalContextSwitches,
+    }
+    summary.update(stats.summary())
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m cpusim.live', description=__doc__.splitlines()[0])
+    parser.add_argument("--algorithm", choices=ALGORITHMS, required=True, help="Scheduling algorithm")
+    parser.add_argument("--quantum", type=int, default=50, help="Round Robin time quantum")
+    parser.add_argument("--data", default='-', help="Arrival stream: a CSV path, '-' for stdin, unix:PATH or tcp:HOST:PORT")
+    parser.add_argument("--out", default='-', help="Completion records CSV ('-' for stdout)")
+    parser.add_argument("--every", type=int, default=0, help="Write a rolling summary every N completions")
+    parser.add_argument("--rolling", default=None, help="File for the rolling summaries (default: stderr)")
+    parser.add_argument("--summary", default=None, help="Also write the final summary as JSON to this path")
+    args = parser.parse_args(argv)
+
+    cls = SCHEDULERS[args.algorithm]
+    try:
+        scheduler = cls(args.quantum) if args.algorithm == 'rr' else cls()
+    except ValueError as e:
+        parser.error(str(e))
+    try:
+        infile = open_input(args.data)
+    except OSError as e:
+        parser.error(f"cannot open {args.data}: {e.strerror or e}")
+    outfile = sys.stdout if args.out == '-' else open(args.out, 'w', newline='')
+    rolling = open(args.rolling, 'w') if args.rolling else None
+    try:
+        summary = schedule_live(scheduler, infile, outfile, args.every, rolling)
+    except ValueError as e:
+        # an out-of-order or malformed row, or an empty stream
+        parser.error(str(e))
+    finally:
+        for f in (infile, outfile, rolling):
+            if f is not None and f not in (sys.stdin, sys.stdout):
+                f.close()
+    if args.summary:
+        write_summary(summary, args.summary)
+
+
+if __name__ == "__main__":
+    main()
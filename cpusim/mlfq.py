@@ -0,0 +1,106 @@
+"""Multi-Level Feedback Queue on top of the Round Robin engine.
+
+Jobs arrive at the top level. A job that uses its whole quantum moves
+down one level, where quanta are usually longer. The scheduler always
+runs the front job of the highest non-empty level, so each decision
+scans at most ``levels`` queues. Every ``boostPeriod`` time units, all
+waiting jobs move back to the top level so long jobs cannot starve.
+Quantum slicing, response/turnaround bookkeeping and context-switch
+counts are the same as in :class:`~cpusim.roundrobin.RoundRobin`. As in
+RR, decisions happen at slice boundaries, so a new arrival waits for the
+current slice to end. Unlike RR, the first job in the input gets no special
+treatment: the earliest arrival runs first.
+"""
+
+from collections import deque
+
+from .roundrobin import RoundRobin, RoundRobinPolicy
+
+
+class LevelQueues:
+    """Ready structure with one FIFO queue per priority level."""
+
+    def __init__(self, quanta, boostPeriod, numJobs):
+        self.quanta = quanta
+        self.boostPeriod = boostPeriod
+        self.queues = [deque() for _ in quanta]
+        self.level = [0] * numJobs
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def admit(self, j):
+        self.level[j] = 0
+        self.queues[0].append(j)
+        self.count += 1
+
+    def requeue(self, j):
+        # used its whole quantum: one level down
+        level = self.level[j] + 1
+        if level == len(self.queues):
+            level -= 1
+        self.level[j] = level
+        self.queues[level].append(j)
+        self.count += 1
+
+    def next_job(self):
+        for queue in self.queues:
+            if queue:
+                self.count -= 1
+                return queue.popleft()
+        raise IndexError("next_job from an empty MLFQ")
+
+    def quantum_of(self, j):
+        return self.quanta[self.level[j]]
+
+    def boost(self):
+        # move every waiting job to the top level, keeping their relative order by level
+        top = self.queues[0]
+        level = self.level
+        for queue in self.queues[1:]:
+            for j in queue:
+                level[j] = 0
+            top.extend(queue)
+            queue.clear()
+
+    def restore(self, saved):
+        # the saved run had a prefix of this run's jobs
+        self.queues = saved.queues
+        self.count = saved.count
+        self.level[:len(saved.level)] = saved.level
+
+
+class LevelPolicy(RoundRobinPolicy):
+    """RR's policy without its first-job rule, which only keeps RR's output byte-compatible with the original script."""
+
+    firstJob = None
+
+
+class MultiLevelFeedbackQueue(RoundRobin):
+
+    name = 'mlfq'
+
+    def __init__(self, quanta=(10, 20, 40), boostPeriod=1000):
+        quanta = tuple(quanta)
+        if not quanta or min(quanta) <= 0:
+            raise ValueError("MLFQ needs at least one level and every quantum must be positive")
+        if boostPeriod is not None and boostPeriod <= 0:
+            raise ValueError("boostPeriod must be positive, or None to disable boosting")
+        super().__init__(quanta[0])
+        self.quanta = quanta
+        self.boostPeriod = boostPeriod
+
+    def __repr__(self):
+        return f"MultiLevelFeedbackQueue(quanta={self.quanta}, boostPeriod={self.boostPeriod})"
+
+    def ready_queue(self, numJobs):
+        return LevelQueues(self.quanta, self.boostPeriod, numJobs)
+
+    def policy(self, jobs):
+        return LevelPolicy(self.ready_queue(len(jobs)), self.quantum)
+
+
+def mlfq(jobs, quanta=(10, 20, 40), boostPeriod=1000):
+    """Run a Multi-Level Feedback Queue with one level per entry of ``quanta`` over ``jobs``."""
+    return MultiLevelFeedbackQueue(quanta, boostPeriod).run(jobs)
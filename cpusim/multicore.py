@@ -0,0 +1,267 @@
+"""Multi-core simulation: FCFS, SJF, STCF and RR on N identical CPUs.
+
+Busy cores sit in a min-heap of ``(next free time, core, job)`` and idle
+cores in a min-heap of core ids, so every scheduling decision costs
+O(log cores) on top of the ready-queue operation. By default all cores
+share one ready queue. With ``workStealing`` (FCFS, SJF and RR) each
+arriving job is placed on the queue of core ``arrival rank % cores``; a
+core runs its own queue first and otherwise steals from the longest one.
+
+The per-job ``core`` column records the core that ran the job's final
+slice. With one core the schedules match the single-CPU engines on
+arrival-sorted traces, including Round Robin's rule that job 0 goes back
+on the queue ahead of the jobs that arrived during its first slice.
+"""
+
+import heapq
+from array import array
+from collections import deque
+
+from .jobs import int_column, int_view
+from .results import ScheduleResult, READY, DONE
+from .scheduler import Scheduler
+
+POLICIES = ('fcfs', 'sjf', 'stcf', 'rr')
+
+
+class MultiCore(Scheduler):
+
+    def __init__(self, algorithm, cores, quantum=50, workStealing=False):
+        if algorithm not in POLICIES:
+            raise ValueError(f"Unknown algorithm {algorithm!r}; expected one of {', '.join(POLICIES)}")
+        if cores < 1:
+            raise ValueError("cores must be at least 1")
+        if algorithm == 'rr' and quantum <= 0:
+            raise ValueError("quantum must be a positive number of time units")
+        if workStealing and algorithm == 'stcf':
+            raise ValueError("STCF preempts across all cores and needs the shared ready queue")
+        self.name = algorithm
+        self.cores = cores
+        self.quantum = quantum if algorithm == 'rr' else None
+        self.workStealing = workStealing
+
+    def __repr__(self):
+        return (f"MultiCore({self.name!r}, cores={self.cores}, quantum={self.quantum}, "
+                f"workStealing={self.workStealing})")
+
+    def run(self, jobs, timeline=None):
+        result = ScheduleResult(self.name, jobs)
+        result.core = int_column(len(jobs), -1)
+        record = timeline.add if timeline is not None else None
+        if self.name == 'stcf':
+            self._run_stcf(jobs, result, record)
+        else:
+            self._run_sliced(jobs, result, record)
+        return result
+
+    def _run_sliced(self, jobs, result, record):
+        # FCFS, SJF and RR: a dispatched job runs for one slice (the whole job unless RR)
+        numJobs = len(jobs)
+        cores = self.cores
+        quantumTime = self.quantum
+        shortestFirst = self.name == 'sjf'
+        workStealing = self.workStealing
+        arrivalTime = int_view(jobs.arrival)
+        jobSize = int_view(jobs.size)
+        remainingTime = array('q', jobSize)
+        firstStart = result.firstStart
+        lastStart = result.lastStart
+        endTime = result.endTime
+        responseTime = result.responseTime
+        turnAroundTime = result.turnAroundTime
+        jobState = result.jobState
+        contextSwitch = result.contextSwitch
+        jobCore = result.core
+
+        order = jobs.arrival_order()
+        rank = int_column(numJobs)
+        for r, j in enumerate(order):
+            rank[j] = r
+        started = bytearray(numJobs)
+        busy = []                       # (slice end, core, job)
+        idle = list(range(cores))       # min-heap of idle core ids
+        i = 0                           # arrival cursor into 'order'
+        completed = 0
+        # on one CPU, RR puts job 0 back ahead of the jobs that arrived during its first slice
+        leadingJob = 0 if self.name == 'rr' and cores == 1 and numJobs and order[0] == 0 else -1
+
+        # one ready queue per core with work stealing, otherwise a single shared one
+        queues = [[] if shortestFirst else deque() for _ in range(cores if workStealing else 1)]
+        longest = []                    # lazy max-heap of (-length, queue) for picking a victim
+
+        def enqueue(j, q):
+            queue = queues[q]
+            if shortestFirst:
+                heapq.heappush(queue, (jobSize[j], rank[j], j))
+            else:
+                queue.append(j)
+            if workStealing:
+                heapq.heappush(longest, (-len(queue), q))
+                if len(longest) > 4 * cores:
+                    # drop stale entries so the heap stays O(cores)
+                    longest[:] = [(-len(queues[k]), k) for k in range(cores) if queues[k]]
+                    heapq.heapify(longest)
+
+        def take(c):
+            # next job for core c, or -1 when there is no work
+            queue = queues[c if workStealing else 0]
+            if not queue and workStealing:
+                while longest:
+                    negLength, q = longest[0]
+                    if queues[q] and -negLength == len(queues[q]):
+                        queue = queues[q]
+                        break
+                    heapq.heappop(longest)
+                    if queues[q]:
+                        heapq.heappush(longest, (-len(queues[q]), q))
+            if not queue:
+                return -1
+            return heapq.heappop(queue)[2] if shortestFirst else queue.popleft()
+
+        def dispatch(c, j, clock):
+            if not started[j]:
+                started[j] = 1
+                firstStart[j] = clock
+                responseTime[j] = clock - arrivalTime[j]
+            lastStart[j] = clock
+            jobCore[j] = c
+            slice_amt = remainingTime[j] if quantumTime is None or remainingTime[j] < quantumTime else quantumTime
+            remainingTime[j] -= slice_amt
+            endTime[j] = clock + slice_amt
+            turnAroundTime[j] = endTime[j] - arrivalTime[j]
+            heapq.heappush(busy, (endTime[j], c, j))
+
+        while completed < numJobs:
+            # arrivals at a time come before slices ending at that time, as on one CPU
+            if i < numJobs and (not busy or arrivalTime[order[i]] <= busy[0][0]):
+                clock = arrivalTime[order[i]]
+                while i < numJobs and arrivalTime[order[i]] <= clock:
+                    j = order[i]
+                    jobState[j] = READY
+                    enqueue(j, i % cores if workStealing else 0)
+                    i += 1
+                while idle:
+                    j = take(idle[0])
+                    if j < 0:
+                        break
+                    dispatch(heapq.heappop(idle), j, clock)
+                continue
+
+            clock, c, j = heapq.heappop(busy)
+            if record is not None:
+                record(j, lastStart[j], clock, c)
+            if remainingTime[j] > 0:
+                # end of an RR quantum: back of the queue of the core that ran it
+                contextSwitch[j] += 1
+                if j == leadingJob:
+                    queues[0].appendleft(j)
+                else:
+                    enqueue(j, c if workStealing else 0)
+            else:
+                jobState[j] = DONE
+                completed += 1
+            leadingJob = -1
+            j = take(c)
+            if j < 0:
+                heapq.heappush(idle, c)
+            else:
+                dispatch(c, j, clock)
+
+    def _run_stcf(self, jobs, result, record):
+        # preemptive: the running jobs are the ones with the least remaining time across all cores
+        numJobs = len(jobs)
+        arrivalTime = int_view(jobs.arrival)
+        jobSize = int_view(jobs.size)
+        firstStart = result.firstStart
+        lastStart = result.lastStart
+        endTime = result.endTime
+        responseTime = result.responseTime
+        turnAroundTime = result.turnAroundTime
+        jobState = result.jobState
+        contextSwitch = result.contextSwitch
+        jobCore = result.core
+
+        order = jobs.arrival_order()
+        started = bytearray(numJobs)
+        ready = []                      # (remaining, arrival rank, job)
+        idle = list(range(self.cores))  # min-heap of idle core ids
+        # a running job finishes at 'finish', so the one with the most time left has the
+        # latest finish; entries carry the dispatch number and are stale once the core moves on
+        finishing = []                  # (finish, rank, core, dispatch)
+        latest = []                     # (-finish, -rank, core, dispatch)
+        runningJob = [-1] * self.cores
+        runningRank = [0] * self.cores
+        runningDispatch = [-1] * self.cores
+        dispatches = 0
+        i = 0
+        completed = 0
+
+        def dispatch(c, clock):
+            nonlocal dispatches
+            remaining, r, j = heapq.heappop(ready)
+            if not started[j]:
+                started[j] = 1
+                firstStart[j] = clock
+                responseTime[j] = clock - arrivalTime[j]
+            lastStart[j] = clock
+            jobCore[j] = c
+            runningJob[c] = j
+            runningRank[c] = r
+            runningDispatch[c] = dispatches
+            finish = clock + remaining
+            endTime[j] = finish
+            heapq.heappush(finishing, (finish, r, c, dispatches))
+            heapq.heappush(latest, (-finish, -r, c, dispatches))
+            dispatches += 1
+
+        while completed < numJobs:
+            # drop entries for jobs that were preempted since they were pushed
+            while finishing and runningDispatch[finishing[0][2]] != finishing[0][3]:
+                heapq.heappop(finishing)
+            if i < numJobs and (not finishing or arrivalTime[order[i]] < finishing[0][0]):
+                clock = arrivalTime[order[i]]
+            else:
+                clock = finishing[0][0]
+
+            # completions at this time come first, then the arrivals, as on one CPU
+            while finishing and finishing[0][0] == clock:
+                finish, r, c, d = heapq.heappop(finishing)
+                if runningDispatch[c] != d:
+                    continue
+                j = runningJob[c]
+                if record is not None:
+                    record(j, lastStart[j], clock, c)
+                runningJob[c] = -1
+                runningDispatch[c] = -1
+                turnAroundTime[j] = clock - arrivalTime[j]
+                jobState[j] = DONE
+                completed += 1
+                heapq.heappush(idle, c)
+            while i < numJobs and arrivalTime[order[i]] <= clock:
+                j = order[i]
+                heapq.heappush(ready, (jobSize[j], i, j))
+                jobState[j] = READY
+                i += 1
+
+            while idle and ready:
+                dispatch(heapq.heappop(idle), clock)
+            # preempt the running job with the most time left while a waiting job is strictly shorter
+            while ready:
+                while runningDispatch[latest[0][2]] != latest[0][3]:
+                    heapq.heappop(latest)
+                negFinish, negRank, c, d = latest[0]
+                j = runningJob[c]
+                remaining = -negFinish - clock
+                if ready[0][0] >= remaining:
+                    break
+                heapq.heappop(latest)
+                if record is not None:
+                    record(j, lastStart[j], clock, c)
+                contextSwitch[j] += 1
+                heapq.heappush(ready, (remaining, runningRank[c], j))
+                dispatch(c, clock)
+
+
+def multicore(jobs, algorithm, cores, quantum=50, workStealing=False):
+    """Run ``algorithm`` ('fcfs', 'sjf', 'stcf' or 'rr') on ``cores`` CPUs over ``jobs``."""
+    return MultiCore(algorithm, cores, quantum, workStealing).run(jobs)
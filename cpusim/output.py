@@ -0,0 +1,172 @@
+"""Writers for the per-algorithm CSV layouts in ``Outputs/``.
+
+Each layout is a list of column names plus the result columns that fill
+them. Rows are formatted and written in chunks of ``CHUNK_ROWS`` with
+one ``%``-format per row instead of a ``csv.writer`` call per row, and
+the same columns can be written to the binary results format of
+:mod:`cpusim.resultfile` instead.
+
+The averages footer is optional (``footer=False``) so typed CSV readers
+can load the file directly; :func:`write_summary` writes the same figures
+to a separate JSON file. Results from multi-core runs get an extra
+trailing ``Core`` column.
+"""
+
+import csv
+import textwrap
+
+# rows formatted and written per chunk
+CHUNK_ROWS = 1 << 16
+
+
+def _clock_layout(result, contextSwitches=False):
+    # layout shared by FCFS and STCF: start/initial clock and end/final clock columns
+    jobs = result.jobs
+    header = ['Index', 'Arrival Time', 'Job Size', 'Start Job', 'Initial Clock Time', 'End Time',
+              'Response Time', 'Turnaround Time', 'Final Clock Time', 'Job State']
+    columns = [jobs.index, jobs.arrival, jobs.size, result.firstStart, result.firstStart, result.endTime,
+               result.responseTime, result.turnAroundTime, result.endTime, result.jobState]
+    if contextSwitches:
+        header.append('Context Switches')
+        columns.append(result.contextSwitch)
+    return header, columns
+
+
+def _clock_footer(result, width):
+    # textwrapped averages under the response and turnaround columns
+    return [['', '', '', '', '', '',
+             textwrap.fill('Average Response Time: ' + str(round(result.averageResponseTime)), 10),
+             textwrap.fill('Average Turnaround Time: ' + str(round(result.averageTurnAroundTime)), 10)]
+            + [''] * (width - 8)]
+
+
+def _fcfs_layout(result):
+    header, columns = _clock_layout(result)
+    return header, columns, None, _clock_footer
+
+
+def _stcf_layout(result):
+    # arrival order, with preemption counts
+    header, columns = _clock_layout(result, contextSwitches=True)
+    return header, columns, result.jobs.arrival_order(), _clock_footer
+
+
+def _sjf_layout(result):
+    jobs = result.jobs
+    header = ['Index', 'Arrival Time', 'Job Size', 'End Time', 'Start Job', 'Response Time',
+              'Turnaround Time', 'Job State']
+    columns = [range(len(result)), jobs.arrival, jobs.size, result.endTime, result.firstStart,
+               result.responseTime, result.turnAroundTime, result.jobState]
+
+    def footer(result, width):
+        return [['Average Response Time', result.averageResponseTime],
+                ['Average Turnaround Time', result.averageTurnAroundTime]]
+    return header, columns, None, footer
+
+
+def _rr_layout(result):
+    # 'Start Job' is the start of the last slice
+    jobs = result.jobs
+    header = ['Index', 'Arrival Time', 'Job Size', 'End Time', 'Start Job', 'Response Time',
+              'Turnaround Time', 'Job State', 'Context Switches']
+    columns = [range(len(result)), jobs.arrival, jobs.size, result.endTime, result.lastStart,
+               result.responseTime, result.turnAroundTime, result.jobState, result.contextSwitch]
+
+    def footer(result, width):
+        return [['Average Response Time', round(result.averageResponseTime, 2)],
+                ['Average Turnaround Time', round(result.averageTurnAroundTime, 2)]]
+    return header, columns, None, footer
+
+
+def _layout(result, layout):
+    header, columns, positions, footer = LAYOUTS[layout](result)
+    if result.core is not None:
+        header = header + ['Core']
+        columns = columns + [result.core]
+    return header, columns, positions, footer
+
+
+def _take(column, positions, start, stop):
+    # rows start:stop of a column (in 'positions' order if given) as a list of Python ints
+    if positions is None:
+        part = column[start:stop]
+    elif hasattr(column, 'take'):
+        part = column.take(positions[start:stop])
+    else:
+        part = [column[i] for i in positions[start:stop]]
+    return part.tolist() if hasattr(part, 'tolist') else part
+
+
+def iter_chunks(columns, positions=None, chunkRows=CHUNK_ROWS):
+    """Yield the columns ``chunkRows`` rows at a time, each chunk as a list of per-column lists."""
+    numRows = len(columns[0])
+    for start in range(0, numRows, chunkRows):
+        yield [_take(column, positions, start, start + chunkRows) for column in columns]
+
+
+def write_csv(result, path, layout, footer=True):
+    """Write ``result`` as CSV in the named layout ('fcfs', 'sjf', 'stcf' or 'rr')."""
+    header, columns, positions, footerRows = _layout(result, layout)
+    rowFormat = ','.join(['%d'] * len(columns)) + '\r\n'
+    with open(path, 'w', newline='') as f:
+        w = csv.writer(f)
+        w.writerow(header)
+        for chunk in iter_chunks(columns, positions):
+            f.write(''.join([rowFormat % row for row in zip(*chunk)]))
+        if footer:
+            w.writerows(footerRows(result, len(header)))
+
+
+def write_binary(result, path, layout):
+    """Write the columns of the named layout to the binary results format (no footer)."""
+    from . import resultfile
+    header, columns, positions, _ = _layout(result, layout)
+    resultfile.write_results(path, header, iter_chunks(columns, positions), len(result))
+
+
+def write_summary(summary, path):
+    """Write a run summary (see :meth:`ScheduleResult.summary`) as JSON, separately from the per-job rows."""
+    import json
+    with open(path, 'w') as f:
+        json.dump(summary, f, indent=2)
+        f.write('\n')
+
+
+def write_fcfs_csv(result, path, footer=True):
+    """Write ``result`` in the ``job1_fcfs.csv`` layout (input order)."""
+    write_csv(result, path, 'fcfs', footer)
+
+
+def write_stcf_csv(result, path, footer=True):
+    """Write ``result`` in the ``Job2_stcf.csv`` layout (arrival order, with preemption counts)."""
+    write_csv(result, path, 'stcf', footer)
+
+
+def write_sjf_csv(result, path, footer=True):
+    """Write ``result`` in the ``job1_sjf.csv`` layout."""
+    write_csv(result, path, 'sjf', footer)
+
+
+def write_rr_csv(result, path, footer=True):
+    """Write ``result`` in the ``job2_rr.csv`` layout (also used for MLFQ, CFS and stride); 'Start Job' is the last slice start."""
+    write_csv(result, path, 'rr', footer)
+
+
+# column layout for each scheduler's output, keyed by layout name
+LAYOUTS = {
+    'fcfs': _fcfs_layout,
+    'sjf': _sjf_layout,
+    'stcf': _stcf_layout,
+    'rr': _rr_layout,
+}
+
+# writer for each scheduler's CSV layout, keyed by Scheduler.name
+WRITERS = {
+    'fcfs': write_fcfs_csv,
+    'sjf': write_sjf_csv,
+    'stcf': write_stcf_csv,
+    'rr': write_rr_csv,
+    'mlfq': write_rr_csv,
+    'cfs': write_rr_csv,
+    'stride': write_rr_csv,
+}
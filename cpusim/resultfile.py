@@ -0,0 +1,117 @@
+"""Columnar binary scheduler results.
+
+Layout (all integers little-endian)::
+
+    offset  0  8 bytes   magic b'CPURSLTS'
+    offset  8  uint32    format version (1)
+    offset 12  uint32    number of columns C
+    offset 16  int64     number of rows N
+    offset 24  uint32    length L of the column-name block
+    offset 28  4 bytes   reserved (zero)
+    offset 32  L bytes   column names as a UTF-8 JSON list, zero-padded to a multiple of 8
+               int64[N]  first column
+               ...       C columns in total
+
+The columns are the ones of the CSV layout in :mod:`cpusim.output`,
+without the averages footer, or any other named int64 columns (the run
+cache in :mod:`cpusim.cache` uses the same format). :func:`load_results`
+maps the file with ``numpy.memmap``, so a column can be read without
+parsing the others.
+
+Inspect a results file from the repository root::
+
+    python -m cpusim.resultfile info Outputs/job2_rr.results
+"""
+
+import argparse
+import json
+import os
+import struct
+from array import array
+
+from .jobs import little_endian
+
+MAGIC = b'CPURSLTS'
+VERSION = 1
+HEADER = struct.Struct('<8sIIqI4x')
+
+
+def write_results(path, names, chunks, numRows):
+    """Write ``numRows`` rows given as an iterable of chunks, each a list of per-column lists.
+
+    Every column is contiguous in the file, so each chunk is spooled to its
+    column's place with one seek and one write per column.
+    """
+    encoded = json.dumps(names).encode('utf-8')
+    encoded += b'\0' * (-len(encoded) % 8)
+    start = HEADER.size + len(encoded)
+    columnBytes = 8 * numRows
+    written = 0
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(names), numRows, len(encoded)))
+        f.write(encoded)
+        f.truncate(start + len(names) * columnBytes)
+        for chunk in chunks:
+            for c, values in enumerate(chunk):
+                f.seek(start + c * columnBytes + 8 * written)
+                little_endian(array('q', values)).tofile(f)
+            written += len(chunk[0])
+    if written != numRows:
+        raise ValueError(f"Expected {numRows} rows but got {written}")
+
+
+def read_header(path):
+    """Return ``(names, numRows, offset)`` where ``offset`` is the start of the first column."""
+    with open(path, 'rb') as f:
+        raw = f.read(HEADER.size)
+        if len(raw) < HEADER.size:
+            raise ValueError(f"{path} is too short to be a results file")
+        magic, version, numColumns, numRows, namesLength = HEADER.unpack(raw)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a results file")
+        if version != VERSION:
+            raise ValueError(f"{path} has unsupported results version {version}")
+        names = json.loads(f.read(namesLength).rstrip(b'\0').decode('utf-8'))
+    offset = HEADER.size + namesLength
+    expected = offset + 8 * numColumns * numRows
+    if len(names) != numColumns or os.path.getsize(path) != expected:
+        raise ValueError(f"{path} is truncated or corrupt: expected {expected} bytes")
+    return names, numRows, offset
+
+
+def load_results(path):
+    """Load a results file as a dict of columns keyed by name.
+
+    With NumPy the columns are read-only ``numpy.memmap`` views; without
+    it they are read into ``array('q')`` columns.
+    """
+    names, numRows, offset = read_header(path)
+    try:
+        import numpy as np
+    except ImportError:
+        columns = {}
+        with open(path, 'rb') as f:
+            f.seek(offset)
+            for name in names:
+                column = array('q')
+                column.fromfile(f, numRows)
+                columns[name] = little_endian(column)
+        return columns
+    columns = np.memmap(path, dtype='<i8', mode='r', offset=offset, shape=(len(names), numRows))
+    return {name: columns[c] for c, name in enumerate(names)}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m cpusim.resultfile', description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest='command', required=True)
+    info = commands.add_parser('info', help='Print the columns and row count of a results file')
+    info.add_argument('results', help='Binary results file')
+    args = parser.parse_args(argv)
+
+    names, numRows, _ = read_header(args.results)
+    print(f"{args.results}: {numRows} rows, format version {VERSION}")
+    print("Columns: " + ', '.join(names))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Per-job results produced by every scheduler."""
+
+from .jobs import int_column
+from .stats import RunStats
+
+# job states, as written to the 'Job State' column
+NEW, READY, DONE = 0, 1, 2
+
+
+def _total(values):
+    # NumPy columns sum in C; plain lists go through the builtin
+    return int(values.sum()) if hasattr(values, 'sum') else sum(values)
+
+
+class ScheduleResult:
+    """Per-job metrics for one scheduler run, aligned with the input job positions.
+
+    Every column is an int64 ``array`` (uint8 for ``jobState``), or a NumPy
+    array when the engine assigns the columns itself.
+    """
+
+    __slots__ = ('algorithm', 'jobs', 'firstStart', 'lastStart', 'endTime',
+                 'responseTime', 'turnAroundTime', 'jobState', 'contextSwitch', 'core', '_stats')
+
+    def __init__(self, algorithm, jobs, allocate=True):
+        self.algorithm = algorithm
+        self.jobs = jobs
+        self.core = None  # per-job core, set by multi-core runs
+        self._stats = None
+        if not allocate:
+            # the engine assigns every column itself (e.g. as NumPy arrays)
+            return
+        numJobs = len(jobs)
+        self.firstStart     = int_column(numJobs)     # first time the job gets the CPU
+        self.lastStart      = int_column(numJobs)     # start of the job's final slice
+        self.endTime        = int_column(numJobs)
+        self.responseTime   = int_column(numJobs)
+        self.turnAroundTime = int_column(numJobs)
+        self.jobState       = int_column(numJobs, NEW, 'B')
+        self.contextSwitch  = int_column(numJobs)
+
+    def __len__(self):
+        return len(self.jobs)
+
+    @property
+    def averageResponseTime(self):
+        return _total(self.responseTime) / len(self.jobs)
+
+    @property
+    def averageTurnAroundTime(self):
+        return _total(self.turnAroundTime) / len(self.jobs)
+
+    @property
+    def totalContextSwitches(self):
+        return _total(self.contextSwitch)
+
+    @property
+    def stats(self):
+        # percentile statistics, fed from the completed columns in fixed-size blocks on first use
+        if self._stats is None:
+            self._stats = RunStats()
+            self._stats.extend(self.responseTime, self.turnAroundTime, self.jobs.size)
+        return self._stats
+
+    def summary(self):
+        summary = {
+            'algorithm': self.algorithm,
+            'jobs': len(self.jobs),
+            'averageResponseTime': self.averageResponseTime,
+            'averageTurnAroundTime': self.averageTurnAroundTime,
+            'contextSwitches': self.totalContextSwitches,
+        }
+        summary.update(self.stats.summary())
+        return summary
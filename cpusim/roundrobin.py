@@ -0,0 +1,97 @@
+"""Round Robin: every ready job gets at most one quantum before going to the back of the queue."""
+
+from collections import deque
+
+from .engine import Policy
+from .scheduler import Scheduler
+
+
+class ReadyQueue(deque):
+    """The Round Robin ready queue: arrivals and preempted jobs both go to the back.
+
+    Subclasses of :class:`RoundRobin` can supply another queue through
+    ``ready_queue``. :class:`RoundRobinPolicy` only calls ``admit(j)`` for arrivals,
+    ``requeue(j)`` for a job that used its whole quantum, ``next_job()``,
+    ``len()``, ``quantum_of(j)`` (``None`` means the scheduler's quantum),
+    every ``boostPeriod`` time units ``boost()`` and, when resuming from a
+    checkpoint, ``restore(saved)`` with the queue of the saved run.
+    """
+
+    admit = deque.append
+    requeue = deque.append
+    next_job = deque.popleft
+    quantum_of = None
+    boostPeriod = None
+
+    def restore(self, saved):
+        self.extend(saved)
+
+
+class RoundRobin(Scheduler):
+
+    name = 'rr'
+
+    def __init__(self, quantum=50):
+        if quantum <= 0:
+            raise ValueError("quantum must be a positive number of time units")
+        self.quantum = quantum
+
+    def __repr__(self):
+        return f"RoundRobin(quantum={self.quantum})"
+
+    def ready_queue(self, numJobs):
+        return ReadyQueue()
+
+    def policy(self, jobs):
+        return RoundRobinPolicy(self.ready_queue(len(jobs)), self.quantum)
+
+
+class RoundRobinPolicy(Policy):
+    """Drives a ready queue from :meth:`RoundRobin.ready_queue`.
+
+    Arrivals that are admitted together are queued in index order. As in
+    the original script, the first job in the input runs first, at its
+    arrival time, and goes back on the queue ahead of anything that arrived
+    during its first quantum.
+    """
+
+    firstJob = 0
+
+    def __init__(self, jobQueue, quantum):
+        self.jobQueue = jobQueue
+        self.quantum = quantum
+        self.quantum_of = jobQueue.quantum_of
+        self.boostPeriod = jobQueue.boostPeriod
+        self.nextBoost = self.boostPeriod if self.boostPeriod else float('inf')
+
+    def admit(self, order, start, stop):
+        admit = self.jobQueue.admit
+        if stop - start > 1:
+            for j in sorted(order[start:stop]):
+                admit(j)
+        else:
+            admit(order[start])
+
+    def next_job(self, clock):
+        jobQueue = self.jobQueue
+        if not jobQueue:
+            return -1
+        if clock >= self.nextBoost:
+            jobQueue.boost()
+            self.nextBoost = (clock // self.boostPeriod + 1) * self.boostPeriod
+        return jobQueue.next_job()
+
+    def requeue(self, j, remaining):
+        self.jobQueue.requeue(j)
+
+    def state(self):
+        return self.jobQueue, self.nextBoost
+
+    def restore(self, state):
+        saved, self.nextBoost = state
+        self.jobQueue.restore(saved)
+
+
+def round_robin(jobs, quantum=50):
+    """Run Round Robin with the given time ``quantum`` over ``jobs``."""
+    return RoundRobin(quantum).run(jobs)
@@ -0,0 +1,26 @@
+"""The interface shared by all scheduling algorithms."""
+
+from .engine import simulate
+
+
+class Scheduler:
+    """Base class for a scheduling policy.
+
+    Subclasses set ``name`` and either implement ``policy(jobs)``, which
+    returns a fresh :class:`~cpusim.engine.Policy` for one run of the
+    discrete-event core, or override ``run(jobs, timeline=None)`` itself.
+    ``run`` takes a :class:`~cpusim.jobs.Jobs` array and returns a
+    :class:`~cpusim.results.ScheduleResult`, passing every CPU slice to
+    ``timeline`` (a :class:`~cpusim.timeline.TimelineWriter`) when given.
+    """
+
+    name = None
+
+    def policy(self, jobs):
+        raise NotImplementedError
+
+    def run(self, jobs, timeline=None):
+        return simulate(self.policy(jobs), jobs, self.name, timeline=timeline)
+
+    def __repr__(self):
+        return f"{type(self).__name__}()"
@@ -0,0 +1,54 @@
+"""Shortest Job First (non-preemptive) on a min-heap of ready jobs.
+
+Whenever the CPU is free, the shortest ready job runs to completion. The
+original script always ran the first job in the input first, at its own
+arrival time. Here job 0 gets no special treatment, so jobs that arrive
+at the same time as it run shortest first as well: three jobs of sizes
+30, 10 and 20 arriving at time 0 now start at 30, 0 and 10 rather than
+0, 30 and 40. ``Outputs/job1_sjf.csv`` is unchanged, because no job in
+``Data/job1.csv`` arrives with job 0.
+"""
+
+import heapq
+
+from .engine import Policy
+from .jobs import int_view
+from .scheduler import Scheduler
+
+
+class ShortestFirstPolicy(Policy):
+    """The ready job with the smallest size runs to completion; ties go to the earlier arrival."""
+
+    def __init__(self, jobs):
+        self.arrivalTime = int_view(jobs.arrival)
+        self.jobSize = int_view(jobs.size)
+        self.heap = []  # min-heap of (jobSize, arrival, index)
+
+    def admit(self, order, start, stop):
+        heap = self.heap
+        arrivalTime = self.arrivalTime
+        jobSize = self.jobSize
+        for i in order[start:stop]:
+            heapq.heappush(heap, (jobSize[i], arrivalTime[i], i))
+
+    def next_job(self, clock):
+        return heapq.heappop(self.heap)[2] if self.heap else -1
+
+    def state(self):
+        return self.heap
+
+    def restore(self, state):
+        self.heap = state
+
+
+class ShortestJobFirst(Scheduler):
+
+    name = 'sjf'
+
+    def policy(self, jobs):
+        return ShortestFirstPolicy(jobs)
+
+
+def sjf(jobs):
+    """Run non-preemptive Shortest Job First over ``jobs``."""
+    return ShortestJobFirst().run(jobs)
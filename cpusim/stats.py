@@ -0,0 +1,211 @@
+"""Streaming per-job statistics in bounded memory.
+
+:class:`StreamingStats` is an HDR-style log-bucketed histogram: values
+below ``2**SUB_BITS`` get one bucket each, larger values share a bucket
+with the others that agree on their top ``SUB_BITS`` bits, so every
+percentile is within 0.4% of an exact one whatever the number of
+values. The count, sum, sum of squares, minimum and maximum are kept
+exactly, which gives the mean, the maximum and Jain's fairness index
+``(sum x)^2 / (n * sum x^2)`` (1.0 when every value is equal).
+
+:class:`RunStats` tracks response, turnaround and wait time (turnaround
+minus job size) for one run. Completed jobs are fed one at a time with
+``record`` (the streaming modes) or as column blocks with ``extend``
+(``ScheduleResult.stats``); either way they are folded into the
+histograms ``BUFFER_SIZE`` values at a time, with NumPy when it is
+installed.
+"""
+
+import math
+
+SUB_BITS = 8
+# values buffered per histogram before they are folded in
+BUFFER_SIZE = 4096
+PERCENTILES = (50, 95, 99)
+
+_np = False  # numpy module once looked up, None when it is not installed
+
+
+def _numpy():
+    global _np
+    if _np is False:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        _np = numpy
+    return _np
+
+
+def _bucket(value):
+    # bucket key: the value itself below 2**SUB_BITS, else (shift, top SUB_BITS bits)
+    shift = value.bit_length() - SUB_BITS
+    if shift <= 0:
+        return value
+    return (shift << SUB_BITS) | (value >> shift)
+
+
+def _bucket_value(key):
+    # midpoint of the values that share bucket 'key'
+    shift = key >> SUB_BITS
+    if shift == 0:
+        return key
+    low = (key & ((1 << SUB_BITS) - 1)) << shift
+    return low + ((1 << shift) - 1) // 2
+
+
+class StreamingStats:
+    """Mean, percentiles, maximum and fairness of a stream of non-negative integers."""
+
+    __slots__ = ('count', 'total', 'sumSquares', 'minimum', 'maximum', 'buckets')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.sumSquares = 0.0
+        self.minimum = None
+        self.maximum = None
+        self.buckets = {}   # bucket key -> count; at most 64 * 2**SUB_BITS keys
+
+    def update(self, values):
+        """Fold a batch of values (a list or a NumPy array) into the histogram."""
+        if not len(values):
+            return
+        if _numpy() is not None:
+            self._update_numpy(values)
+            return
+        minimum = min(values)
+        if minimum < 0:
+            raise ValueError("StreamingStats only takes non-negative values")
+        buckets = self.buckets
+        for v in values:
+            key = _bucket(v)
+            buckets[key] = buckets.get(key, 0) + 1
+        self._update_totals(len(values), sum(values), math.fsum(v * v for v in values), minimum, max(values))
+
+    def _update_numpy(self, values):
+        np = _numpy()
+        values = np.asarray(values, dtype=np.int64)
+        if values.min() < 0:
+            raise ValueError("StreamingStats only takes non-negative values")
+        # bit_length from the float exponent, exact for values below 2**53
+        shift = np.frexp(values.astype(np.float64))[1] - SUB_BITS
+        np.maximum(shift, 0, out=shift)
+        keys = np.where(shift > 0, (shift.astype(np.int64) << SUB_BITS) | (values >> shift), values)
+        buckets = self.buckets
+        counts = np.bincount(keys)
+        for key in counts.nonzero()[0].tolist():
+            buckets[key] = buckets.get(key, 0) + int(counts[key])
+        asFloat = values.astype(np.float64)
+        self._update_totals(len(values), int(values.sum()), float(asFloat @ asFloat),
+                            int(values.min()), int(values.max()))
+
+    def _update_totals(self, count, total, sumSquares, minimum, maximum):
+        self.count += count
+        self.total += total
+        self.sumSquares += sumSquares
+        self.minimum = minimum if self.minimum is None or minimum < self.minimum else self.minimum
+        self.maximum = maximum if self.maximum is None or maximum > self.maximum else self.maximum
+
+    def merge(self, other):
+        """Add the values recorded by another accumulator."""
+        if not other.count:
+            return
+        for key, n in other.buckets.items():
+            self.buckets[key] = self.buckets.get(key, 0) + n
+        self._update_totals(other.count, other.total, other.sumSquares, other.minimum, other.maximum)
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    @property
+    def fairness(self):
+        if not self.sumSquares:
+            return 1.0
+        return self.total * self.total / (self.count * self.sumSquares)
+
+    def percentile(self, q):
+        """Estimate of the value at percentile ``q`` (nearest rank), clamped to the observed range."""
+        if not self.count:
+            return 0
+        rank = max(1, math.ceil(q / 100 * self.count))
+        seen = 0
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if seen >= rank:
+                return min(max(_bucket_value(key), self.minimum), self.maximum)
+        return self.maximum
+
+    def report(self):
+        report = {'mean': self.mean}
+        for q in PERCENTILES:
+            report[f'p{q}'] = self.percentile(q)
+        report['max'] = self.maximum or 0
+        report['fairness'] = self.fairness
+        return report
+
+
+class RunStats:
+    """Response, turnaround and wait time statistics for one scheduler run."""
+
+    __slots__ = ('responseTime', 'turnAroundTime', 'waitTime', '_pending')
+
+    def __init__(self):
+        self.responseTime = StreamingStats()
+        self.turnAroundTime = StreamingStats()
+        self.waitTime = StreamingStats()
+        self._pending = ([], [], [])
+
+    def record(self, responseTime, turnAroundTime, jobSize):
+        """Record one completed job."""
+        response, turnaround, wait = self._pending
+        response.append(responseTime)
+        turnaround.append(turnAroundTime)
+        wait.append(turnAroundTime - jobSize)
+        if len(response) == BUFFER_SIZE:
+            self.flush()
+
+    def extend(self, responseTimes, turnAroundTimes, jobSizes):
+        """Record a batch of completed jobs given as equal-length columns."""
+        self.flush()
+        np = _numpy()
+        for start in range(0, len(responseTimes), BUFFER_SIZE):
+            stop = start + BUFFER_SIZE
+            if np is not None:
+                turnaround = np.asarray(turnAroundTimes[start:stop], dtype=np.int64)
+                wait = turnaround - np.asarray(jobSizes[start:stop], dtype=np.int64)
+            else:
+                turnaround = list(turnAroundTimes[start:stop])
+                wait = [t - s for t, s in zip(turnaround, jobSizes[start:stop])]
+            self.responseTime.update(responseTimes[start:stop])
+            self.turnAroundTime.update(turnaround)
+            self.waitTime.update(wait)
+
+    def flush(self):
+        # fold the buffered jobs into the histograms
+        for stats, values in zip((self.responseTime, self.turnAroundTime, self.waitTime), self._pending):
+            stats.update(values)
+            values.clear()
+
+    def summary(self):
+        """Percentile reports for response and turnaround time, plus the longest wait."""
+        self.flush()
+        return {
+            'responseTime': self.responseTime.report(),
+            'turnAroundTime': self.turnAroundTime.report(),
+            'maxWaitTime': self.waitTime.maximum or 0,
+        }
+
+
+def format_report(summary):
+    """Render the statistics of a run summary as a small text table."""
+    lines = [f"{'':<16}{'mean':>12}" + ''.join(f"{'p' + str(q):>12}" for q in PERCENTILES)
+             + f"{'max':>12}{'fairness':>10}"]
+    for label, key in (('Response', 'responseTime'), ('Turnaround', 'turnAroundTime')):
+        report = summary[key]
+        lines.append(f"{label:<16}{report['mean']:>12.2f}"
+                     + ''.join(f"{report[f'p{q}']:>12.0f}" for q in PERCENTILES)
+                     + f"{report['max']:>12}{report['fairness']:>10.3f}")
+    lines.append(f"{'Max wait':<16}{summary['maxWaitTime']:>12}")
+    return '\n'.join(lines)
@@ -0,0 +1,64 @@
+"""Shortest Time to Completion First (preemptive SJF)."""
+
+import heapq
+
+from .engine import Policy
+from .jobs import int_view
+from .scheduler import Scheduler
+
+
+class ShortestRemainingPolicy(Policy):
+    """Waiting jobs sit in a heap of ``(remaining, arrival rank, index)``; the running job is kept outside it."""
+
+    preemptive = True
+
+    def __init__(self, jobs):
+        self.jobSize = int_view(jobs.size)
+        self.heap = []
+        self.runningRank = 0
+
+    def admit(self, order, start, stop):
+        heap = self.heap
+        jobSize = self.jobSize
+        for i in range(start, stop):
+            j = order[i]
+            heapq.heappush(heap, (jobSize[j], i, j))
+
+    def next_job(self, clock):
+        if not self.heap:
+            return -1
+        remaining, self.runningRank, j = heapq.heappop(self.heap)
+        return j
+
+    def preempts(self, remaining):
+        # only a job that is strictly shorter than what is left
+        return self.heap[0][0] < remaining if self.heap else False
+
+    def requeue(self, j, remaining):
+        heapq.heappush(self.heap, (remaining, self.runningRank, j))
+
+    def state(self):
+        return self.heap, self.runningRank
+
+    def restore(self, state):
+        self.heap, self.runningRank = state
+
+
+class ShortestTimeToCompletionFirst(Scheduler):
+    """Preemptive SJF.
+
+    The running job is kept outside the ready heap. When jobs arrive they
+    are pushed onto the heap, and the running job is only preempted when
+    the shortest waiting job needs strictly less time than it has left.
+    Each real preemption counts as a context switch of the preempted job.
+    """
+
+    name = 'stcf'
+
+    def policy(self, jobs):
+        return ShortestRemainingPolicy(jobs)
+
+
+def stcf(jobs):
+    """Run preemptive Shortest Time to Completion First over ``jobs``."""
+    return ShortestTimeToCompletionFirst().run(jobs)
@@ -0,0 +1,74 @@
+"""Single-pass schedulers that read one job at a time and write each result row straight away."""
+
+import csv
+import textwrap
+
+from .results import DONE
+from .stats import RunStats
+
+
+def stream_fcfs(infile, outfile, footer=True):
+    """Run First Come First Serve from the open CSV ``infile`` to ``outfile`` in one pass.
+
+    Jobs are served in the order they appear in the input, which must be
+    arrival order; a job that arrives before the previous one raises
+    ValueError, as the batch engine would serve it earlier. Only the previous end time and the running totals are
+    kept, so memory stays constant and ``infile`` can be a pipe. With
+    ``footer=False`` the averages row is left out; they are still returned,
+    together with the percentile statistics of :class:`~cpusim.stats.RunStats`.
+    """
+    reader = csv.reader(infile)
+    writer = csv.writer(outfile)
+    next(reader, None)  # skip the header row
+    writer.writerow(['Index', 'Arrival Time', 'Job Size', 'Start Job', 'Initial Clock Time', 'End Time',
+                     'Response Time', 'Turnaround Time', 'Final Clock Time', 'Job State'])
+
+    clock = 0
+    numJobs = 0
+    totalResponseTime = 0
+    totalTurnAroundTime = 0
+    stats = RunStats()
+    record = stats.record
+    lastArrival = None
+    for row in reader:
+        if not row:
+            continue
+        arrivalTime = int(row[1])
+        if lastArrival is not None and arrivalTime < lastArrival:
+            raise ValueError(f"Job {row[0]} arrives at {arrivalTime}, before the previous job; "
+                             "streamed input must be in arrival order")
+        lastArrival = arrivalTime
+        jobSize = int(row[2])
+
+        # the job starts once the previous one has finished, or when it arrives
+        start = clock if clock > arrivalTime else arrivalTime
+        clock = start + jobSize
+        responseTime = start - arrivalTime
+        turnAroundTime = clock - arrivalTime
+        writer.writerow([row[0], arrivalTime, jobSize, start, start, clock,
+                         responseTime, turnAroundTime, clock, DONE])
+
+        numJobs += 1
+        totalResponseTime += responseTime
+        totalTurnAroundTime += turnAroundTime
+        record(responseTime, turnAroundTime, jobSize)
+
+    if numJobs == 0:
+        raise ValueError("The input CSV has no data rows")
+
+    averageResponseTime = totalResponseTime / numJobs
+    averageTurnAroundTime = totalTurnAroundTime / numJobs
+    if footer:
+        writer.writerow(['', '', '', '', '', '',
+                         textwrap.fill('Average Response Time: ' + str(round(averageResponseTime)), 10),
+                         textwrap.fill('Average Turnaround Time: ' + str(round(averageTurnAroundTime)), 10),
+                         '', ''])
+    summary = {
+        'algorithm': 'fcfs',
+        'jobs': numJobs,
+        'averageResponseTime': averageResponseTime,
+        'averageTurnAroundTime': averageTurnAroundTime,
+        'contextSwitches': 0,
+    }
+    summary.update(stats.summary())
+    return summary
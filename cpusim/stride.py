@@ -0,0 +1,80 @@
+"""Stride scheduling: deterministic proportional share by tickets.
+
+Every job holds tickets (its weight, see :func:`cpusim.cfs.load_weights`)
+and has a stride of ``STRIDE1 / tickets``. The job with the smallest pass
+value runs for one quantum, after which its pass advances by its stride,
+so over time each job gets CPU in proportion to its tickets. New jobs
+join at the pass of the job dispatched last, the smallest pass in the
+system, so they cannot monopolize the CPU to catch up. The pass values
+sit in a binary heap, so each decision costs O(log n).
+"""
+
+import heapq
+
+from .cfs import weight_column, weights_key
+from .engine import Policy
+from .scheduler import Scheduler
+
+STRIDE1 = 1 << 32
+
+
+class StridePolicy(Policy):
+    """Waiting jobs sit in a heap of ``(pass, sequence, index)``; the running job is kept outside it."""
+
+    def __init__(self, tickets, quantum):
+        self.tickets = tickets
+        self.quantum = quantum
+        self.heap = []
+        self.sequence = 0           # insertion count, so equal passes run first in, first out
+        self.globalPass = 0
+        self.currentPass = 0
+
+    def admit(self, order, start, stop):
+        heap = self.heap
+        globalPass = self.globalPass
+        sequence = self.sequence
+        for i in range(start, stop):
+            heapq.heappush(heap, (globalPass, sequence, order[i]))
+            sequence += 1
+        self.sequence = sequence
+
+    def next_job(self, clock):
+        if not self.heap:
+            return -1
+        self.currentPass, _, j = heapq.heappop(self.heap)
+        if self.currentPass > self.globalPass:
+            self.globalPass = self.currentPass
+        return j
+
+    def requeue(self, j, remaining):
+        heapq.heappush(self.heap, (self.currentPass + STRIDE1 // self.tickets[j], self.sequence, j))
+        self.sequence += 1
+
+    def state(self):
+        return self.heap, self.sequence, self.globalPass, self.currentPass
+
+    def restore(self, state):
+        self.heap, self.sequence, self.globalPass, self.currentPass = state
+
+
+class StrideScheduling(Scheduler):
+    """Stride scheduling with a fixed ``quantum`` and per-job ``weights`` as tickets (``{index: tickets}``)."""
+
+    name = 'stride'
+
+    def __init__(self, quantum=50, weights=None):
+        if quantum <= 0:
+            raise ValueError("quantum must be a positive number of time units")
+        self.quantum = quantum
+        self.weights = weights
+
+    def __repr__(self):
+        return f"StrideScheduling(quantum={self.quantum}, weights={weights_key(self.weights)})"
+
+    def policy(self, jobs):
+        return StridePolicy(weight_column(jobs, self.weights), self.quantum)
+
+
+def stride(jobs, quantum=50, weights=None):
+    """Run stride scheduling with the given time ``quantum`` over ``jobs``."""
+    return StrideScheduling(quantum, weights).run(jobs)
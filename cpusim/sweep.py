@@ -0,0 +1,123 @@
+"""Parameter sweeps: evaluate a grid of algorithms, quanta and datasets across a process pool.
+
+Each trace is loaded once in the parent and copied into a shared memory
+block. Workers attach to those blocks when they start, so the job arrays
+are never pickled per task; a task only carries its dataset name,
+algorithm and quantum.
+
+Run from the repository root::
+
+    python -m cpusim.sweep --data Data/Job2.csv --algorithms stcf,rr --quanta 10,25,50,100
+"""
+
+import argparse
+import csv
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from . import SCHEDULERS, Jobs, load_jobs
+
+COLUMNS = ['Dataset', 'Algorithm', 'Quantum', 'Jobs', 'Average Response Time',
+           'Average Turnaround Time', 'Context Switches', 'P95 Response Time', 'P99 Response Time',
+           'P99 Turnaround Time', 'Max Wait Time']
+
+# algorithms whose scheduler takes a time quantum, which the sweep varies over --quanta
+QUANTUM_ALGORITHMS = ('rr', 'stride')
+
+# per-worker views of the shared traces: dataset -> (SharedMemory, Jobs)
+_datasets = {}
+
+
+def _attach(blocks):
+    # pool initializer: map every shared trace into this worker without copying it
+    for dataset, (blockName, numJobs) in blocks.items():
+        block = shared_memory.SharedMemory(name=blockName)
+        columns = block.buf.cast('q')
+        jobs = Jobs(range(numJobs), columns[:numJobs], columns[numJobs:2 * numJobs])
+        _datasets[dataset] = (block, jobs)
+
+
+def _run_config(dataset, algorithm, quantum):
+    jobs = _datasets[dataset][1]
+    scheduler = SCHEDULERS[algorithm](quantum) if algorithm in QUANTUM_ALGORITHMS else SCHEDULERS[algorithm]()
+    summary = scheduler.run(jobs).summary()
+    summary['dataset'] = dataset
+    summary['quantum'] = quantum
+    return summary
+
+
+def configurations(datasets, algorithms, quanta):
+    """Expand the grid; the quantum only varies for Round Robin and stride scheduling."""
+    grid = []
+    for dataset in datasets:
+        for algorithm in algorithms:
+            if algorithm not in SCHEDULERS:
+                raise ValueError(f"Unknown algorithm {algorithm!r}; expected one of {', '.join(SCHEDULERS)}")
+            for quantum in (quanta if algorithm in QUANTUM_ALGORITHMS else [None]):
+                grid.append((dataset, algorithm, quantum))
+    return grid
+
+
+def sweep(traces, algorithms, quanta, workers=None):
+    """Run every configuration of the grid and return one summary dict per configuration.
+
+    ``traces`` maps a dataset name to its :class:`~cpusim.jobs.Jobs`.
+    """
+    blocks = {}
+    handles = []
+    try:
+        for dataset, jobs in traces.items():
+            numJobs = len(jobs)
+            packed = array('q', jobs.arrival)
+            packed.extend(array('q', jobs.size))
+            block = shared_memory.SharedMemory(create=True, size=max(1, len(packed) * packed.itemsize))
+            handles.append(block)
+            block.buf[:len(packed) * packed.itemsize] = packed.tobytes()
+            blocks[dataset] = (block.name, numJobs)
+
+        grid = configurations(traces, algorithms, quanta)
+        with ProcessPoolExecutor(max_workers=workers, initializer=_attach, initargs=(blocks,)) as pool:
+            futures = [pool.submit(_run_config, *config) for config in grid]
+            return [future.result() for future in futures]
+    finally:
+        for block in handles:
+            block.close()
+            block.unlink()
+
+
+def write_summary(summaries, outfile):
+    """Write the sweep summaries as one CSV table."""
+    writer = csv.writer(outfile)
+    writer.writerow(COLUMNS)
+    for s in summaries:
+        writer.writerow([s['dataset'], s['algorithm'], '' if s['quantum'] is None else s['quantum'], s['jobs'],
+                         round(s['averageResponseTime'], 2), round(s['averageTurnAroundTime'], 2),
+                         s['contextSwitches'], s['responseTime']['p95'], s['responseTime']['p99'],
+                         s['turnAroundTime']['p99'], s['maxWaitTime']])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m cpusim.sweep', description=__doc__.splitlines()[0])
+    parser.add_argument("--data", nargs='+', required=True, help="One or more input CSV traces")
+    parser.add_argument("--algorithms", default=','.join(SCHEDULERS), help="Comma-separated algorithms")
+    parser.add_argument("--quanta", default="50", help="Comma-separated quanta for Round Robin and stride")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--out", default=None, help="Optional output CSV for the summary table")
+    args = parser.parse_args(argv)
+
+    traces = {path: load_jobs(path) for path in args.data}
+    quanta = [int(q) for q in args.quanta.split(',')]
+    summaries = sweep(traces, args.algorithms.split(','), quanta, args.workers)
+
+    if args.out:
+        with open(args.out, 'w', newline='') as f:
+            write_summary(summaries, f)
+        print(f"Sweep of {len(summaries)} configurations saved to {args.out}")
+    else:
+        write_summary(summaries, sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
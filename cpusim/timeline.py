@@ -0,0 +1,254 @@
+"""Run-length compressed execution timelines (who held the CPU from when to when).
+
+A :class:`TimelineWriter` receives every CPU slice of a run as it ends.
+Consecutive slices of the same job on the same core are coalesced into
+one segment (a Round Robin job that is alone in the system runs quantum
+after quantum). Segments are buffered in blocks of ``BLOCK_SEGMENTS`` and
+streamed to the side file, so the timeline is never held in memory. A
+path ending in ``.csv`` gets ``Job,Start,End,Core`` rows; any other path
+gets the indexed binary format.
+
+Binary layout (all integers little-endian)::
+
+    offset  0  8 bytes   magic b'CPUTMLNE'
+    offset  8  uint32    format version (1)
+    offset 12  uint32    segments per block
+    offset 16  int64     number of segments
+    offset 24  int64     number of blocks B
+    offset 32  int64     number of jobs N
+    offset 40  int64     offset of the block index
+    offset 48            the blocks: zlib-compressed int64 columns Job, Start, Duration, Core
+    block index          int64[B] each: offset, compressed length, segments, earliest start, latest end
+    job index            int64[N] each: job Index sorted, first block, last block of that job
+
+``Job`` is the job's ``Index`` column value. The block index is the
+sparse index for time windows: only the blocks whose span overlaps the
+window are read. The job index is searched by bisection through a memory
+map, and only the blocks between the job's first and last segment are
+read. :func:`query` does both without scanning the file.
+
+Record and query a timeline from the repository root::
+
+    python -m cpusim stcf --data Data/Job2.csv --out job2_stcf.csv --timeline job2_stcf.timeline
+    python -m cpusim.timeline query job2_stcf.timeline --start 5000 --end 6000
+    python -m cpusim.timeline query job2_stcf.timeline --job 17
+"""
+
+import argparse
+import csv
+import mmap
+import os
+import struct
+import sys
+import zlib
+from array import array
+from collections import deque
+from itertools import compress, repeat
+from operator import add, sub
+
+from .jobs import int_view, little_endian
+
+MAGIC = b'CPUTMLNE'
+VERSION = 1
+HEADER = struct.Struct('<8sIIqqqq')
+INT64 = struct.Struct('<q')
+BLOCK_SEGMENTS = 4096
+CSV_HEADER = ['Job', 'Start', 'End', 'Core']
+
+
+class TimelineWriter:
+    """Streams the coalesced CPU segments of one run to ``path``; ``jobIndex`` is the trace's Index column.
+
+    The engines call ``add(j, start, end, core)`` with the job's position
+    whenever a slice ends. Use it as a context manager, or call
+    :meth:`close`, to flush the last segments and write the indexes.
+    """
+
+    def __init__(self, path, jobIndex, blockSegments=BLOCK_SEGMENTS):
+        self.path = path
+        self.jobIndex = int_view(jobIndex)
+        self.blockSegments = blockSegments
+        self.binary = os.path.splitext(path)[1].lower() != '.csv'
+        self.pending = {}           # core -> [job, start, end, core] of the segment still growing there
+        self.buffer = []            # finished segments of the current block
+        self.numSegments = 0
+        self.f = open(path, 'wb' if self.binary else 'w', newline=None if self.binary else '')
+        if self.binary:
+            self.f.write(HEADER.pack(MAGIC, VERSION, blockSegments, 0, 0, 0, 0))
+            self.blocks = [array('q') for _ in range(5)]
+            numJobs = len(jobIndex)
+            self.firstBlock = array('q', [-1]) * numJobs
+            self.lastBlock = array('q', [-1]) * numJobs
+        else:
+            self.writer = csv.writer(self.f)
+            self.writer.writerow(CSV_HEADER)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def add(self, j, start, end, core=0):
+        """Record that job position ``j`` ran on ``core`` from ``start`` to ``end``."""
+        segment = self.pending.get(core)
+        if segment is not None:
+            if segment[0] == j and segment[2] == start:
+                segment[2] = end
+                return
+            buffer = self.buffer
+            buffer.append(segment)
+            if len(buffer) == self.blockSegments:
+                self._flush()
+        self.pending[core] = [j, start, end, core]
+
+    def _flush(self):
+        buffer = self.buffer
+        if not buffer:
+            return
+        self.buffer = []
+        self.numSegments += len(buffer)
+        positions, starts, ends, cores = zip(*buffer)
+        job = array('q', map(self.jobIndex.__getitem__, positions))
+        if self.binary:
+            block = len(self.blocks[0])
+            lastBlock = self.lastBlock
+            # jobs not seen before start in this block; the updates run as C-level maps
+            new = list(compress(positions, map((-1).__eq__, map(lastBlock.__getitem__, positions))))
+            deque(map(self.firstBlock.__setitem__, new, repeat(block)), maxlen=0)
+            deque(map(lastBlock.__setitem__, positions, repeat(block)), maxlen=0)
+            starts = array('q', starts)
+            durations = array('q', map(sub, ends, starts))
+            span = (min(starts), max(ends))
+            raw = b''.join(little_endian(column).tobytes()
+                           for column in (job, starts, durations, array('q', cores)))
+            data = zlib.compress(raw, 1)
+            for column, value in zip(self.blocks, (self.f.tell(), len(data), len(job)) + span):
+                column.append(value)
+            self.f.write(data)
+        else:
+            self.writer.writerows(zip(job, starts, ends, cores))
+
+    def close(self):
+        if self.f.closed:
+            return
+        for core in sorted(self.pending):
+            self.buffer.append(self.pending[core])
+            if len(self.buffer) == self.blockSegments:
+                self._flush()
+        self.pending.clear()
+        self._flush()
+        if self.binary:
+            self._write_indexes()
+        self.f.close()
+
+    def _write_indexes(self):
+        f = self.f
+        indexOffset = f.tell()
+        for column in self.blocks:
+            little_endian(column).tofile(f)
+        # the job index is sorted by Index value so lookups can bisect it
+        keys = array('q', self.jobIndex)
+        if any(map(int.__gt__, keys, keys[1:])):
+            order = sorted(range(len(keys)), key=keys.__getitem__)
+            keys = array('q', map(keys.__getitem__, order))
+            self.firstBlock = array('q', map(self.firstBlock.__getitem__, order))
+            self.lastBlock = array('q', map(self.lastBlock.__getitem__, order))
+        for column in (keys, self.firstBlock, self.lastBlock):
+            little_endian(column).tofile(f)
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, VERSION, self.blockSegments, self.numSegments,
+                            len(self.blocks[0]), len(keys), indexOffset))
+
+
+def read_header(path):
+    """Return ``(segments, blocks, jobs, indexOffset)`` of a binary timeline."""
+    with open(path, 'rb') as f:
+        raw = f.read(HEADER.size)
+    if len(raw) < HEADER.size:
+        raise ValueError(f"{path} is too short to be a binary timeline")
+    magic, version, _, numSegments, numBlocks, numJobs, indexOffset = HEADER.unpack(raw)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a binary timeline")
+    if version != VERSION:
+        raise ValueError(f"{path} has unsupported timeline version {version}")
+    expected = indexOffset + 8 * (5 * numBlocks + 3 * numJobs)
+    if indexOffset == 0 or os.path.getsize(path) != expected:
+        raise ValueError(f"{path} is truncated or was not closed: expected {expected} bytes")
+    return numSegments, numBlocks, numJobs, indexOffset
+
+
+def _read_block(f, offset, length, count):
+    f.seek(offset)
+    column = little_endian(array('q', zlib.decompress(f.read(length))))
+    job, starts, durations, cores = (column[c * count:(c + 1) * count] for c in range(4))
+    return zip(job, starts, map(add, starts, durations), cores)
+
+
+def _job_blocks(mm, indexOffset, numBlocks, numJobs, job):
+    # the block range of every job whose Index is 'job', found by bisecting the sorted keys
+    keysOffset = indexOffset + 40 * numBlocks
+    lo, hi = 0, numJobs
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if INT64.unpack_from(mm, keysOffset + 8 * mid)[0] < job:
+            lo = mid + 1
+        else:
+            hi = mid
+    blocks = set()
+    while lo < numJobs and INT64.unpack_from(mm, keysOffset + 8 * lo)[0] == job:
+        first = INT64.unpack_from(mm, keysOffset + 8 * (numJobs + lo))[0]
+        last = INT64.unpack_from(mm, keysOffset + 8 * (2 * numJobs + lo))[0]
+        if first >= 0:
+            blocks.update(range(first, last + 1))
+        lo += 1
+    return blocks
+
+
+def query(path, start=None, end=None, job=None):
+    """Yield the ``(job, start, end, core)`` segments that overlap ``[start, end]`` and belong to ``job``.
+
+    Any of the three can be None to leave that side unconstrained. Only
+    the blocks the indexes point at are read and decompressed.
+    """
+    numSegments, numBlocks, numJobs, indexOffset = read_header(path)
+    low = -sys.maxsize if start is None else start
+    high = sys.maxsize if end is None else end
+    with open(path, 'rb') as f:
+        f.seek(indexOffset)
+        offsets, lengths, counts, earliest, latest = (
+            little_endian(array('q', f.read(8 * numBlocks))) for _ in range(5))
+        blocks = [b for b in range(numBlocks) if earliest[b] <= high and latest[b] >= low]
+        if job is not None:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                blocks = sorted(_job_blocks(mm, indexOffset, numBlocks, numJobs, job).intersection(blocks))
+        for b in blocks:
+            for segment in _read_block(f, offsets[b], lengths[b], counts[b]):
+                if segment[1] <= high and segment[2] >= low and (job is None or segment[0] == job):
+                    yield segment
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m cpusim.timeline', description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest='command', required=True)
+    info = commands.add_parser('info', help='Print the segment, block and job counts of a binary timeline')
+    info.add_argument('timeline', help='Binary timeline file')
+    select = commands.add_parser('query', help='Print the segments in a time window and/or of one job as CSV')
+    select.add_argument('timeline', help='Binary timeline file')
+    select.add_argument('--start', type=int, default=None, help='Start of the time window')
+    select.add_argument('--end', type=int, default=None, help='End of the time window')
+    select.add_argument('--job', type=int, default=None, help='Index of the job')
+    args = parser.parse_args(argv)
+
+    if args.command == 'info':
+        numSegments, numBlocks, numJobs, _ = read_header(args.timeline)
+        print(f"{args.timeline}: {numSegments} segments in {numBlocks} blocks, {numJobs} jobs, "
+              f"format version {VERSION}")
+    else:
+        writer = csv.writer(sys.stdout)
+        writer.writerow(CSV_HEADER)
+        writer.writerows(query(args.timeline, args.start, args.end, args.job))
+
+
+if __name__ == "__main__":
+    main()
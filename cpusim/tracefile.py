@@ -0,0 +1,145 @@
+"""Compact columnar binary job traces.
+
+Layout (all integers little-endian)::
+
+    offset  0  8 bytes   magic b'CPUTRACE'
+    offset  8  uint32    format version (1)
+    offset 12  uint32    number of columns (3)
+    offset 16  int64     number of jobs N
+    offset 24  8 bytes   reserved (zero)
+    offset 32  int64[N]  Index
+               int64[N]  Arrival Time
+               int64[N]  Job Size
+
+Each column is contiguous, so :func:`load_trace` maps the file with
+``numpy.memmap`` and hands out the columns without parsing or copying.
+
+Convert a CSV trace from the repository root::
+
+    python -m cpusim.tracefile convert Data/Job2.csv Data/Job2.trace
+"""
+
+import argparse
+import csv
+import os
+import struct
+from array import array
+
+from .jobs import Jobs, little_endian
+
+MAGIC = b'CPUTRACE'
+VERSION = 1
+HEADER = struct.Struct('<8sIIq8x')
+COLUMNS = 3
+
+# rows buffered per column before they are flushed to disk during conversion
+CHUNK_ROWS = 1 << 20
+
+
+def is_trace_file(path):
+    """Return True when ``path`` starts with the binary trace magic."""
+    try:
+        with open(path, 'rb') as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def read_header(path):
+    """Return the number of jobs recorded in the trace header."""
+    with open(path, 'rb') as f:
+        raw = f.read(HEADER.size)
+    if len(raw) < HEADER.size:
+        raise ValueError(f"{path} is too short to be a binary trace")
+    magic, version, columns, numJobs = HEADER.unpack(raw)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a binary trace")
+    if version != VERSION or columns != COLUMNS:
+        raise ValueError(f"{path} has unsupported trace version {version} with {columns} columns")
+    expected = HEADER.size + COLUMNS * 8 * numJobs
+    if os.path.getsize(path) != expected:
+        raise ValueError(f"{path} is truncated: expected {expected} bytes for {numJobs} jobs")
+    return numJobs
+
+
+def write_trace(path, jobs):
+    """Write an in-memory :class:`~cpusim.jobs.Jobs` array as a binary trace."""
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, COLUMNS, len(jobs)))
+        for column in (jobs.index, jobs.arrival, jobs.size):
+            if hasattr(column, 'astype'):
+                f.write(column.astype('<i8', copy=False).tobytes())
+            else:
+                little_endian(array('q', column)).tofile(f)
+
+
+def convert_csv(csvPath, tracePath):
+    """Convert an ``Index,Arrival Time,Job Size`` CSV to a binary trace in bounded memory.
+
+    Columns are spooled to temporary files chunk by chunk and concatenated
+    after the row count is known. Returns the number of jobs written.
+    """
+    import shutil
+    import tempfile
+
+    directory = os.path.dirname(os.path.abspath(tracePath))
+    spools = [tempfile.TemporaryFile(dir=directory) for _ in range(COLUMNS)]
+    try:
+        numJobs = 0
+        buffers = [array('q') for _ in range(COLUMNS)]
+        with open(csvPath, 'r', newline='') as f:
+            reader = csv.reader(f)
+            next(reader, None)  # skip the header row
+            for row in reader:
+                buffers[0].append(int(row[0]))
+                buffers[1].append(int(row[1]))
+                buffers[2].append(int(row[2]))
+                numJobs += 1
+                if len(buffers[0]) == CHUNK_ROWS:
+                    for buffer, spool in zip(buffers, spools):
+                        little_endian(buffer).tofile(spool)
+                    buffers = [array('q') for _ in range(COLUMNS)]
+        for buffer, spool in zip(buffers, spools):
+            little_endian(buffer).tofile(spool)
+
+        with open(tracePath, 'wb') as out:
+            out.write(HEADER.pack(MAGIC, VERSION, COLUMNS, numJobs))
+            for spool in spools:
+                spool.seek(0)
+                shutil.copyfileobj(spool, out)
+        return numJobs
+    finally:
+        for spool in spools:
+            spool.close()
+
+
+def load_trace(path):
+    """Memory-map a binary trace; the returned columns are read-only ``numpy.memmap`` views."""
+    import numpy as np
+
+    numJobs = read_header(path)
+    if numJobs == 0:
+        raise ValueError("The input trace has no jobs")
+    columns = np.memmap(path, dtype='<i8', mode='r', offset=HEADER.size, shape=(COLUMNS, numJobs))
+    return Jobs(columns[0], columns[1], columns[2])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m cpusim.tracefile', description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest='command', required=True)
+    convert = commands.add_parser('convert', help='Convert a CSV trace to the binary format')
+    convert.add_argument('csv', help='Input CSV trace')
+    convert.add_argument('trace', help='Output binary trace')
+    info = commands.add_parser('info', help='Print the header of a binary trace')
+    info.add_argument('trace', help='Binary trace')
+    args = parser.parse_args(argv)
+
+    if args.command == 'convert':
+        numJobs = convert_csv(args.csv, args.trace)
+        print(f"Converted {numJobs} jobs to {args.trace}")
+    else:
+        print(f"{args.trace}: {read_header(args.trace)} jobs, format version {VERSION}")
+
+
+if __name__ == "__main__":
+    main()
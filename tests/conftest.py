@@ -0,0 +1,5 @@
+import os
+import sys
+
+# the tests import cpusim from the repository root, as the scripts in Algorithms/ do
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
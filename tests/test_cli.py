@@ -0,0 +1,12 @@
+from cpusim.cli import run_algorithm
+
+TRACE = 'Index,Arrival Time,Job Size\n0,0,5\n1,2,3\n'
+
+
+def test_binary_format_reports_a_binary_result_file(tmp_path, capsys):
+    trace = tmp_path / 'trace.csv'
+    trace.write_text(TRACE)
+    out = tmp_path / 'out.bin'
+    run_algorithm('rr', ['--data', str(trace), '--out', str(out), '--format', 'binary'])
+    stdout = capsys.readouterr().out
+    assert stdout == f"Binary result file written. Output saved to {out}\n"
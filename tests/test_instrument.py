@@ -0,0 +1,30 @@
+from cpusim import SCHEDULERS
+from cpusim.instrument import Instrumentation
+from cpusim.jobs import load_jobs
+
+
+def _counters(tmp_path, scheduler, rows):
+    trace = tmp_path / 'trace.csv'
+    trace.write_text('Index,Arrival Time,Job Size\n' + ''.join(f'{row}\n' for row in rows))
+    instruments = Instrumentation(count=True)
+    instruments.run(scheduler, load_jobs(str(trace)))
+    return instruments.counters
+
+
+def test_rr_counts_the_first_job_and_the_jump_to_it(tmp_path):
+    # slices 10-15, 15-20 (job 0), 20-23 (job 1), 23-25 (job 0), then idle until 40 and 40-45 (job 2)
+    counters = _counters(tmp_path, SCHEDULERS['rr'](5), ['0,10,12', '1,12,3', '2,40,5'])
+    assert counters == {
+        'dispatches': 5, 'admitted': 2, 'admitBatches': 2, 'requeues': 2, 'preemptions': 0,
+        'preemptionChecks': 0, 'queuePushes': 4, 'queuePops': 4, 'idleJumps': 2, 'idleTime': 25,
+        'maxReadyDepth': 2,
+    }
+
+
+def test_fcfs_counts_the_jump_to_the_first_arrival(tmp_path):
+    counters = _counters(tmp_path, SCHEDULERS['fcfs'](), ['0,7,3', '1,20,2'])
+    assert counters == {
+        'dispatches': 2, 'admitted': 2, 'admitBatches': 2, 'requeues': 0, 'preemptions': 0,
+        'preemptionChecks': 0, 'queuePushes': 2, 'queuePops': 2, 'idleJumps': 2, 'idleTime': 17,
+        'maxReadyDepth': 1,
+    }
@@ -0,0 +1,27 @@
+import pytest
+
+from cpusim.live import main
+
+
+def run_live(tmp_path, capsys, text, *options):
+    trace = tmp_path / 'stream.csv'
+    trace.write_text(text)
+    with pytest.raises(SystemExit) as exit:
+        main(['--data', str(trace), '--out', str(tmp_path / 'out.csv'), *options])
+    assert exit.value.code == 2
+    return capsys.readouterr().err
+
+
+def test_out_of_order_row_is_a_usage_error(tmp_path, capsys):
+    err = run_live(tmp_path, capsys, 'Index,Arrival Time,Job Size\n0,10,5\n1,4,5\n', '--algorithm', 'fcfs')
+    assert "Job 1 arrives at 4, before the previous job" in err
+
+
+def test_empty_stream_is_a_usage_error(tmp_path, capsys):
+    err = run_live(tmp_path, capsys, 'Index,Arrival Time,Job Size\n', '--algorithm', 'sjf')
+    assert "has no jobs" in err
+
+
+def test_bad_quantum_is_a_usage_error(tmp_path, capsys):
+    err = run_live(tmp_path, capsys, 'Index,Arrival Time,Job Size\n0,0,5\n', '--algorithm', 'rr', '--quantum', '0')
+    assert "quantum must be a positive" in err
@@ -0,0 +1,30 @@
+import io
+
+import pytest
+
+from cpusim.cli import run_algorithm
+from cpusim.streaming import stream_fcfs
+
+UNSORTED = 'Index,Arrival Time,Job Size\n0,0,5\n1,10,5\n2,4,5\n'
+
+
+def test_stream_fcfs_rejects_out_of_order_arrivals():
+    with pytest.raises(ValueError, match="Job 2 arrives at 4, before the previous job"):
+        stream_fcfs(io.StringIO(UNSORTED), io.StringIO())
+
+
+def test_stream_option_reports_unsorted_trace_as_usage_error(tmp_path, capsys):
+    trace = tmp_path / 'unsorted.csv'
+    trace.write_text(UNSORTED)
+    with pytest.raises(SystemExit) as exit:
+        run_algorithm('fcfs', ['--data', str(trace), '--out', str(tmp_path / 'out.csv'), '--stream'])
+    assert exit.value.code == 2
+    assert "streamed input must be in arrival order" in capsys.readouterr().err
+
+
+def test_stream_matches_batch_on_sorted_trace(tmp_path):
+    trace = tmp_path / 'sorted.csv'
+    trace.write_text('Index,Arrival Time,Job Size\n0,0,5\n1,2,5\n2,20,1\n\n')
+    run_algorithm('fcfs', ['--data', str(trace), '--out', str(tmp_path / 'stream.csv'), '--stream'])
+    run_algorithm('fcfs', ['--data', str(trace), '--out', str(tmp_path / 'batch.csv')])
+    assert (tmp_path / 'stream.csv').read_text() == (tmp_path / 'batch.csv').read_text()